@@ -0,0 +1,50 @@
+"""Compare per-item create_rectangle calls against main.bulk_create on a real Tk canvas.
+
+Needs a display (or Xvfb). Usage: python bench_bulk_shapes.py [count] [repeats]
+"""
+import tkinter as tk
+import time
+import sys
+
+import main
+
+def build_coords(count:int)-> list:
+    columns = int(count ** 0.5) + 1
+    return [((index % columns) * 4, (index // columns) * 4, (index % columns) * 4 + 3, (index // columns) * 4 + 3) for index in range(count)]
+
+def time_per_item(canvas, coords:list, options:dict)-> float:
+    start = time.perf_counter()
+    for item_coords in coords:
+        canvas.create_rectangle(item_coords, tags="loop", **options)
+    elapsed = time.perf_counter() - start
+    assert len(canvas.find_withtag("loop")) == len(coords)
+    canvas.delete("all")
+    return elapsed
+
+def time_bulk(canvas, coords:list, options:dict)-> float:
+    start = time.perf_counter()
+    ids = main.bulk_create(canvas, "rectangle", coords, ("bulk",), options)
+    elapsed = time.perf_counter() - start
+    assert len(ids) == len(coords) and list(canvas.find_withtag("bulk")) == ids
+    assert canvas.itemcget(ids[-1], "fill") == options["fill"]
+    canvas.delete("all")
+    return elapsed
+
+def main_benchmark(count:int, repeats:int)-> None:
+    root = tk.Tk()
+    root.withdraw()
+    root.tk.eval(main.BULK_CREATE_PROC)
+    canvas = tk.Canvas(root, width=950, height=810)
+    coords = build_coords(count)
+    options = {"fill": "#3366CC", "outline": "#000000", "width": 1}
+
+    per_item = min(time_per_item(canvas, coords, options) for _ in range(repeats))
+    bulk = min(time_bulk(canvas, coords, options) for _ in range(repeats))
+    print(f"Tk {root.tk.call('info', 'patchlevel')}, {count} rectangles, best of {repeats}")
+    print(f"per-item create_rectangle : {per_item:.3f} s")
+    print(f"bulk_create               : {bulk:.3f} s")
+    print(f"speed-up                  : {per_item / bulk:.1f}x")
+    root.destroy()
+
+if __name__ == "__main__":
+    main_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100000, int(sys.argv[2]) if len(sys.argv) > 2 else 3)
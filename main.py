@@ -7,13 +7,26 @@ current_canvas.itemconfigure(current_canvas.find_closest(current_canvas.canvasx(
 """
 
 #? Importations
-from tkinter.filedialog import askopenfilename
+from tkinter.filedialog import askopenfilename, asksaveasfilename, askdirectory
+from concurrent.futures import ThreadPoolExecutor
+from xml.sax.saxutils import escape, quoteattr
+from collections import OrderedDict
 from tkinter.colorchooser import askcolor
-from PIL import Image, ImageTk
+import xml.etree.ElementTree as ET
+from PIL import Image, ImageTk, ImageDraw, ImageFont, ImageChops
 import customtkinter as ctk
+import tkinter.font as tkfont
 import tkinter as tk
+import subprocess
+import threading
+import base64
+import shutil
+import math
 import time
 import sys
+import io
+import os
+import re
 
 #? Tooltip Class
 class CTkToolTip(tk.Toplevel):
@@ -201,6 +214,9 @@ class CTkToolTip(tk.Toplevel):
         self.messageVar.set(message)
         self.message_label.configure(**kwargs)
 
+#? Paths
+ASSETS_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
 #? Tools Enumerators
 CURSOR = 0
 MOVE = 1
@@ -215,6 +231,382 @@ ERASER = 9
 TEXT = 10
 IMAGE = 11
 
+#? Mini-map Constants
+MINIMAP_WIDTH = 240
+MINIMAP_HEIGHT = 200
+MINIMAP_PADDING = 10
+MINIMAP_REGION_LIMIT = 16
+MINIMAP_REGION_PROC = """
+proc ::colorful_region_items {canvas x0 y0 x1 y1} {
+    set result {}
+    foreach item [$canvas find overlapping $x0 $y0 $x1 $y1] {
+        set tags [$canvas gettags $item]
+        if {"delete" in $tags || "selection" in $tags || [$canvas itemcget $item -state] eq "hidden"} {
+            continue
+        }
+        set type [$canvas type $item]
+        if {$type in {line polygon rectangle oval}} {
+            set coords [$canvas coords $item]
+        } else {
+            set coords [$canvas bbox $item]
+        }
+        set fill ""
+        set outline ""
+        if {$type in {line polygon rectangle oval text}} {
+            set fill [$canvas itemcget $item -fill]
+        }
+        if {$type in {polygon rectangle oval}} {
+            set outline [$canvas itemcget $item -outline]
+        }
+        lappend result $type $coords $fill $outline
+    }
+    return $result
+}
+"""
+
+#? Bulk Creation Constants
+BULK_CHUNK_SIZE = 5000
+BULK_CREATE_PROC = """
+proc ::colorful_bulk_create {canvas type tags coords_list} {
+    set first ""
+    foreach coords $coords_list {
+        set last [$canvas create $type $coords -tags $tags]
+        if {$first eq ""} {
+            set first $last
+        }
+    }
+    if {$first eq ""} {
+        return {}
+    }
+    return [list $first $last]
+}
+"""
+
+#? SVG Constants
+SVG_PROGRESS_STEP = 2000
+SVG_CURVE_STEPS = 8
+SVG_NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+SVG_PATH_COMMAND = re.compile(r"[\s,]*([MmLlHhVvCcSsQqTtAaZz])")
+SVG_PATH_NUMBER = re.compile(r"[\s,]*(" + SVG_NUMBER + ")")
+SVG_PATH_FLAG = re.compile(r"[\s,]*([01])")
+SVG_PATH_ARGUMENTS = {"M": 2, "L": 2, "H": 1, "V": 1, "C": 6, "S": 4, "Q": 4, "T": 2, "A": 7, "Z": 0}
+SVG_SKIPPED_TAGS = {"defs", "pattern", "marker", "clipPath", "mask", "symbol", "metadata", "title", "desc", "style"}
+SVG_STYLE_ATTRIBUTES = {"fill", "stroke", "stroke-width", "stroke-dasharray", "opacity", "fill-opacity", "stroke-opacity", "font-family", "font-size", "text-anchor", "dominant-baseline"}
+STIPPLE_OPACITIES = {"gray75": 0.75, "gray50": 0.5, "gray25": 0.25, "gray12": 0.125}
+BUILTIN_STIPPLES = {"gray75": [0x77, 0xdd], "gray50": [0x55, 0xaa], "gray25": [0x88, 0x22], "gray12": [0x88, 0x00, 0x22, 0x00]}
+IDENTITY_MATRIX = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+#? Symbol Constants
+SYMBOL_SCALE_BUCKETS = 4
+SYMBOL_SUPERSAMPLING = 2
+SYMBOL_OVAL_STEPS = 32
+SYMBOL_OPTIONS = {
+    "line": ("fill", "width", "dash", "stipple", "smooth", "arrow", "arrowshape", "capstyle"),
+    "rectangle": ("fill", "outline", "width", "dash", "stipple"),
+    "oval": ("fill", "outline", "width", "dash", "stipple"),
+    "polygon": ("fill", "outline", "width", "dash", "stipple", "smooth"),
+    "text": ("text", "fill", "font", "anchor", "angle"),
+    "image": ("image", "anchor")
+}
+PIL_ANCHORS = {"nw": "la", "n": "ma", "ne": "ra", "w": "lm", "center": "mm", "e": "rm", "sw": "ld", "s": "md", "se": "rd"}
+
+#? Image Pyramid Constants
+IMAGE_CACHE_BYTES = 256 * 1024 * 1024
+IMAGE_CROP_PIXELS = 2048 * 2048
+IMAGE_POLL_DELAY = 30
+IMAGE_WORKERS = 2
+IMAGE_PLACEHOLDER_COLOR = (128, 128, 128, 255)
+
+#? Font Constants
+FONT_FALLBACKS = ["Ubuntu", "DejaVu Sans", "Liberation Sans", "Arial", "Helvetica", "Noto Sans"]
+FONT_EXTENSIONS = (".ttf", ".otf", ".ttc")
+FONT_MATCH_TIMEOUT = 2
+
+#? Export Constants
+EXPORT_FORMATS = {"PNG": ".png", "WebP": ".webp", "Lossless WebP": ".webp"}
+EXPORT_WEBP_QUALITY = 90
+
+#? SVG Helpers
+def multiply_matrix(parent:tuple, child:tuple)-> tuple:
+    a, b, c, d, e, f = parent
+    return (a * child[0] + c * child[1], b * child[0] + d * child[1],
+            a * child[2] + c * child[3], b * child[2] + d * child[3],
+            a * child[4] + c * child[5] + e, b * child[4] + d * child[5] + f)
+
+def apply_matrix(matrix:tuple, x:float, y:float)-> tuple:
+    return (matrix[0] * x + matrix[2] * y + matrix[4], matrix[1] * x + matrix[3] * y + matrix[5])
+
+def parse_svg_transform(text:str)-> tuple:
+    matrix = IDENTITY_MATRIX
+    for name, arguments in re.findall(r"(\w+)\s*\(([^)]*)\)", text):
+        numbers = [float(value) for value in re.findall(SVG_NUMBER, arguments)]
+        values = numbers + [0.0] * 6
+        if name == "matrix":
+            child = tuple(values[:6])
+        elif name == "translate":
+            child = (1.0, 0.0, 0.0, 1.0, values[0], values[1])
+        elif name == "scale":
+            child = (values[0], 0.0, 0.0, numbers[1] if len(numbers) > 1 else values[0], 0.0, 0.0)
+        elif name == "rotate":
+            angle = math.radians(values[0])
+            cos, sin = math.cos(angle), math.sin(angle)
+            child = multiply_matrix(multiply_matrix((1.0, 0.0, 0.0, 1.0, values[1], values[2]), (cos, sin, -sin, cos, 0.0, 0.0)), (1.0, 0.0, 0.0, 1.0, -values[1], -values[2]))
+        elif name == "skewX":
+            child = (1.0, 0.0, math.tan(math.radians(values[0])), 1.0, 0.0, 0.0)
+        elif name == "skewY":
+            child = (1.0, math.tan(math.radians(values[0])), 0.0, 1.0, 0.0, 0.0)
+        else:
+            continue
+        matrix = multiply_matrix(matrix, child)
+    return matrix
+
+def parse_svg_style(element, style:dict)-> dict:
+    style = dict(style)
+    style.update((key, value) for key, value in element.attrib.items() if key in SVG_STYLE_ATTRIBUTES)
+    style.update((key.strip(), value.strip()) for key, value in (declaration.split(":", 1) for declaration in element.get("style", "").split(";") if ":" in declaration))
+    return style
+
+def parse_svg_length(text:str, default:float=0.0)-> float:
+    match = re.match(SVG_NUMBER, text.strip()) if text else None
+    return float(match.group(0)) if match else default
+
+def parse_svg_path(data:str)-> list:
+    subpaths = []
+    points = []
+    x = y = start_x = start_y = 0.0
+    control = None
+    command = previous = None
+    position = 0
+
+    def read(pattern)-> str:
+        nonlocal position
+        match = pattern.match(data, position)
+        if match is None:
+            return None
+        position = match.end()
+        return match.group(1)
+
+    def bezier(controls:list)-> None:
+        for step in range(1, SVG_CURVE_STEPS + 1):
+            t = step / SVG_CURVE_STEPS
+            weights = [(1 - t) ** 2, 2 * (1 - t) * t, t ** 2] if len(controls) == 3 else [(1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t ** 2, t ** 3]
+            points.append((sum(w * p[0] for w, p in zip(weights, controls)), sum(w * p[1] for w, p in zip(weights, controls))))
+
+    def arc(rx:float, ry:float, angle:float, large_arc:float, sweep:float, end_x:float, end_y:float)-> None:
+        rx, ry = abs(rx), abs(ry)
+        if not rx or not ry or (x, y) == (end_x, end_y):
+            points.append((end_x, end_y))
+            return
+        cos_phi, sin_phi = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+        half_x, half_y = (x - end_x) / 2, (y - end_y) / 2
+        x1, y1 = cos_phi * half_x + sin_phi * half_y, -sin_phi * half_x + cos_phi * half_y
+        radii = x1 ** 2 / rx ** 2 + y1 ** 2 / ry ** 2
+        if radii > 1:
+            rx, ry = rx * math.sqrt(radii), ry * math.sqrt(radii)
+        factor = math.sqrt(max(0.0, (rx ** 2 * ry ** 2 - rx ** 2 * y1 ** 2 - ry ** 2 * x1 ** 2) / (rx ** 2 * y1 ** 2 + ry ** 2 * x1 ** 2)))
+        if bool(large_arc) == bool(sweep):
+            factor = -factor
+        center_x, center_y = factor * rx * y1 / ry, -factor * ry * x1 / rx
+        start = math.atan2((y1 - center_y) / ry, (x1 - center_x) / rx)
+        delta = math.atan2((-y1 - center_y) / ry, (-x1 - center_x) / rx) - start
+        if sweep and delta < 0:
+            delta += 2 * math.pi
+        elif not sweep and delta > 0:
+            delta -= 2 * math.pi
+        center_x, center_y = cos_phi * center_x - sin_phi * center_y + (x + end_x) / 2, sin_phi * center_x + cos_phi * center_y + (y + end_y) / 2
+        steps = max(1, math.ceil(abs(delta) / (math.pi / 2) * SVG_CURVE_STEPS))
+        for step in range(1, steps):
+            theta = start + delta * step / steps
+            point_x, point_y = rx * math.cos(theta), ry * math.sin(theta)
+            points.append((cos_phi * point_x - sin_phi * point_y + center_x, sin_phi * point_x + cos_phi * point_y + center_y))
+        points.append((end_x, end_y))
+
+    while True:
+        letter = read(SVG_PATH_COMMAND)
+        if letter:
+            command = letter
+        elif command is None or SVG_PATH_NUMBER.match(data, position) is None:
+            break
+        upper = command.upper()
+        count = SVG_PATH_ARGUMENTS[upper]
+        if upper == "Z":
+            if points:
+                subpaths.append((points, True))
+            points = []
+            x, y = start_x, start_y
+            command = previous = None
+            continue
+        tokens = [read(SVG_PATH_FLAG if upper == "A" and argument in (3, 4) else SVG_PATH_NUMBER) for argument in range(count)]
+        if None in tokens:
+            break
+        values = [float(token) for token in tokens]
+        relative = command.islower()
+        if upper == "H":
+            values = [values[0] + (x if relative else 0.0), y]
+        elif upper == "V":
+            values = [x, values[0] + (y if relative else 0.0)]
+        elif upper == "A":
+            values = values[:5] + [values[5] + (x if relative else 0.0), values[6] + (y if relative else 0.0)]
+        elif relative:
+            values = [value + (x if position % 2 == 0 else y) for position, value in enumerate(values)]
+
+        if upper == "M":
+            if len(points) > 1:
+                subpaths.append((points, False))
+            points = [(values[0], values[1])]
+            start_x, start_y = values[0], values[1]
+            command = "l" if relative else "L"
+        elif upper == "C":
+            bezier([(x, y), (values[0], values[1]), (values[2], values[3]), (values[4], values[5])])
+        elif upper == "S":
+            first = (2 * x - control[0], 2 * y - control[1]) if previous in ("C", "S") else (x, y)
+            bezier([(x, y), first, (values[0], values[1]), (values[2], values[3])])
+        elif upper == "Q":
+            bezier([(x, y), (values[0], values[1]), (values[2], values[3])])
+        elif upper == "T":
+            values = [2 * x - control[0], 2 * y - control[1]] + values if previous in ("Q", "T") else [x, y] + values
+            bezier([(x, y), (values[0], values[1]), (values[2], values[3])])
+        elif upper == "A":
+            arc(*values)
+        else:
+            points.append((values[-2], values[-1]))
+        control = (values[-4], values[-3]) if upper in "CSQT" else None
+        previous = upper
+        x, y = values[-2], values[-1]
+
+    if len(points) > 1:
+        subpaths.append((points, False))
+    return subpaths
+
+def get_smooth_segments(pairs:list, closed:bool)-> tuple:
+    if closed:
+        pairs = pairs + pairs[:2]
+        start = ((pairs[0][0] + pairs[1][0]) / 2, (pairs[0][1] + pairs[1][1]) / 2)
+    else:
+        start = pairs[0]
+    segments = []
+    for index in range(1, len(pairs) - 1):
+        end = pairs[index + 1] if not closed and index == len(pairs) - 2 else ((pairs[index][0] + pairs[index + 1][0]) / 2, (pairs[index][1] + pairs[index + 1][1]) / 2)
+        segments.append((pairs[index], end))
+    return start, segments
+
+def flatten_smooth_path(pairs:list, closed:bool)-> list:
+    start, segments = get_smooth_segments(pairs, closed)
+    if not segments:
+        return list(pairs)
+    points = [start]
+    for control, end in segments:
+        origin = points[-1]
+        for step in range(1, SVG_CURVE_STEPS + 1):
+            t = step / SVG_CURVE_STEPS
+            points.append(((1 - t) ** 2 * origin[0] + 2 * (1 - t) * t * control[0] + t ** 2 * end[0], (1 - t) ** 2 * origin[1] + 2 * (1 - t) * t * control[1] + t ** 2 * end[1]))
+    return points
+
+def get_arrow_points(tip:tuple, tail:tuple, width:float, shape:tuple)-> list:
+    length = math.hypot(tip[0] - tail[0], tip[1] - tail[1]) or 1
+    ux, uy = (tip[0] - tail[0]) / length, (tip[1] - tail[1]) / length
+    neck, back, side = shape[0], shape[1], shape[2] + width / 2
+    return [tip, (tip[0] - ux * back - uy * side, tip[1] - uy * back + ux * side), (tip[0] - ux * neck, tip[1] - uy * neck), (tip[0] - ux * back + uy * side, tip[1] - uy * back - ux * side)]
+
+def offset_points(points:list, offset:tuple)-> list:
+    if offset == (0, 0):
+        return points
+    return [(x - offset[0], y - offset[1]) for x, y in points]
+
+def dash_polyline(points:list, pattern:list)-> list:
+    pattern = [length for length in pattern if length > 0]
+    if not pattern:
+        return [points]
+    dashes = []
+    current = [points[0]]
+    index, remaining, drawing = 0, pattern[0], True
+    for (x0, y0), (x1, y1) in zip(points, points[1:]):
+        length = math.hypot(x1 - x0, y1 - y0)
+        position = 0.0
+        while length - position > remaining:
+            position += remaining
+            point = (x0 + (x1 - x0) * position / length, y0 + (y1 - y0) * position / length)
+            if drawing:
+                dashes.append(current + [point])
+            current = [point]
+            drawing = not drawing
+            index = (index + 1) % len(pattern)
+            remaining = pattern[index]
+        remaining -= length - position
+        current.append((x1, y1))
+    if drawing and len(current) > 1:
+        dashes.append(current)
+    return dashes
+
+def read_xbm(path:str)-> tuple:
+    with open(path) as file:
+        data = file.read()
+    width = int(re.search(r"_width\s+(\d+)", data).group(1))
+    height = int(re.search(r"_height\s+(\d+)", data).group(1))
+    values = [int(value, 16) for value in re.findall(r"0x([0-9a-fA-F]+)", data)]
+    row_bytes = (width + 7) // 8
+    rows = [[bool(values[row * row_bytes + column // 8] >> (column % 8) & 1) for column in range(width)] for row in range(height)]
+    return width, height, rows
+
+#? Bulk Creation Helpers
+def bulk_create(canvas, kind:str, coords_list, tags:tuple, options:dict)-> list:
+    if hasattr(coords_list, "tolist"):
+        coords_list = coords_list.tolist()
+    ids = []
+    try:
+        for start in range(0, len(coords_list), BULK_CHUNK_SIZE):
+            chunk = tuple(tk._flatten(coords) for coords in coords_list[start:start + BULK_CHUNK_SIZE])
+            span = canvas.tk.splitlist(canvas.tk.call("::colorful_bulk_create", canvas._w, kind, tags, chunk))
+            if span:
+                ids.extend(range(int(span[0]), int(span[1]) + 1))
+        if ids and options:
+            canvas.itemconfigure(tags[0], **options)
+    except tk.TclError:
+        canvas.delete(tags[0])
+        raise
+    return ids
+
+#? Raster Helpers
+def rotate_layer(layer, pivot:tuple, rotation:float, resample=Image.BICUBIC)-> tuple:
+    if not rotation % 360:
+        return (layer, pivot)
+    radius = math.ceil(max(math.hypot(x - pivot[0], y - pivot[1]) for x in (0, layer.width) for y in (0, layer.height))) + 1
+    square = Image.new("RGBA", (2 * radius, 2 * radius), (0, 0, 0, 0))
+    square.paste(layer, (round(radius - pivot[0]), round(radius - pivot[1])))
+    return (square.rotate(-rotation, resample), (radius, radius))
+
+def composite_layer(image, layer, x:int, y:int)-> None:
+    box = (max(0, -x), max(0, -y), min(layer.width, image.width - x), min(layer.height, image.height - y))
+    if box[0] < box[2] and box[1] < box[3]:
+        image.alpha_composite(layer, (x + box[0], y + box[1]), box)
+
+#? Export Helpers
+def encode_image(image, image_format:str, compress_level:int=6, lossy_palette:bool=False, path:str=None)-> tuple:
+    start = time.perf_counter()
+    label = image_format
+    if image_format == "PNG":
+        colors = image.getcolors(maxcolors=256)
+        if colors is not None:
+            palette = Image.new("P", (1, 1))
+            palette.putpalette([value for _, color in colors for value in color])
+            image = image.quantize(palette=palette, dither=Image.Dither.NONE)
+            label = "Indexed PNG"
+        elif lossy_palette:
+            image = image.quantize(colors=256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+            label = "Quantized PNG"
+        options = {"optimize": True} if compress_level == 9 else {"compress_level": compress_level}
+    elif image_format == "WebP":
+        options = {"quality": EXPORT_WEBP_QUALITY, "method": 6}
+    else:
+        options = {"lossless": True, "quality": 100, "method": 6}
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG" if image_format == "PNG" else "WEBP", **options)
+    if path:
+        with open(path, "wb") as file:
+            file.write(buffer.getbuffer())
+    return (label, buffer.getbuffer().nbytes, time.perf_counter() - start)
+
 #? App Class
 class App(ctk.CTk):
 
@@ -242,12 +634,42 @@ class App(ctk.CTk):
         self.pressed_special_keys = set()
         self.crtl_z_items = []
         self.current_line_number = "line_0"
+        self.bulk_number = 0
         self.canvas_number = 0
         self.selected_canvas_item = None
         self.images = []
+        self.image_sources = {}
+        self.image_pyramid_keys = {}
+        self.image_items = {}
+        self.image_loads = {}
+        self.pyramid_levels = OrderedDict()
+        self.pyramid_sizes = {}
+        self.pyramid_bytes = 0
+        self.pyramid_lock = threading.Lock()
+        self.image_executor = ThreadPoolExecutor(max_workers=IMAGE_WORKERS)
+        self.export_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 2)
+        self.image_poll_pending = False
+        self.svg_colors = {}
+        self.symbols = {}
+        self.symbol_rasters = {}
+        self.symbol_photos = {}
+        self.symbol_image_refs = {}
+        self.symbol_instances = {}
+        self.symbol_number = 0
+        self.focused_symbols = set()
+        self.selected_items = []
+        self.selection_canvas = None
         self.current_image_index = 0
         self.polygon_points = []
         self.line_points = []
+        self.minimap_source = None
+        self.minimap_image = Image.new("RGB", (MINIMAP_WIDTH, MINIMAP_HEIGHT))
+        self.minimap_photo = ImageTk.PhotoImage(image=self.minimap_image)
+        self.minimap_dirty = []
+        self.minimap_full_render = True
+        self.minimap_scale = 1.0
+        self.minimap_origin = (0.0, 0.0)
+        self.minimap_update_pending = False
         self.anchors_dict = {
             "Center": "center",
             "Top left": "nw",
@@ -265,27 +687,39 @@ class App(ctk.CTk):
             "Semi thick": "gray50",
             "Semi thin": "gray25",
             "Thin": "gray12",
-            "Flowers": "@./assets/flowers_pattern.xbm",
-            "Silk": "@./assets/silk_pattern.xbm",
-            "Floor": "@./assets/floor_pattern.xbm",
-            "Stars": "@./assets/stars_pattern.xbm",
-            "Circles": "@./assets/circles_pattern.xbm",
-            "Waves": "@./assets/waves_pattern.xbm"
+            "Flowers": "@" + os.path.join(ASSETS_DIRECTORY, "flowers_pattern.xbm"),
+            "Silk": "@" + os.path.join(ASSETS_DIRECTORY, "silk_pattern.xbm"),
+            "Floor": "@" + os.path.join(ASSETS_DIRECTORY, "floor_pattern.xbm"),
+            "Stars": "@" + os.path.join(ASSETS_DIRECTORY, "stars_pattern.xbm"),
+            "Circles": "@" + os.path.join(ASSETS_DIRECTORY, "circles_pattern.xbm"),
+            "Waves": "@" + os.path.join(ASSETS_DIRECTORY, "waves_pattern.xbm")
         }
+        self.pattern_bits = {}
+        self.pattern_tiles = {}
+        self.pattern_masks = {}
+        self.available_fonts = None
+        self.resolved_fonts = {}
+        self.fonts = {}
+        self.font_specs = {}
+        self.font_files = {}
+        self.font_paths = None
+        self.pil_fonts = {}
+        self.text_extents = {}
+        self.text_groups = {}
 
         #? Images
-        self.cursor_icon = ImageTk.PhotoImage(image=Image.open("./assets/cursor_icon.png").resize((40, 40)))
-        self.move_icon = ImageTk.PhotoImage(image=Image.open("./assets/move_icon.png").resize((40, 40)))
-        self.zoom_icon = ImageTk.PhotoImage(image=Image.open("./assets/zoom_icon.png").resize((40, 40)))
-        self.hand_icon = ImageTk.PhotoImage(image=Image.open("./assets/hand_icon.png").resize((40, 40)))
-        self.line_icon = ImageTk.PhotoImage(image=Image.open("./assets/line_icon.png").resize((40, 40)))
-        self.square_icon = ImageTk.PhotoImage(image=Image.open("./assets/square_icon.png").resize((40, 40)))
-        self.circle_icon = ImageTk.PhotoImage(image=Image.open("./assets/circle_icon.png").resize((40, 40)))
-        self.polygon_icon = ImageTk.PhotoImage(image=Image.open("./assets/polygon_icon.png").resize((40, 40)))
-        self.pencil_icon = ImageTk.PhotoImage(image=Image.open("./assets/pencil_icon.png").resize((40, 40)))
-        self.eraser_icon = ImageTk.PhotoImage(image=Image.open("./assets/eraser_icon.png").resize((40, 40)))
-        self.text_icon = ImageTk.PhotoImage(image=Image.open("./assets/text_icon.png").resize((40, 40)))
-        self.image_icon = ImageTk.PhotoImage(image=Image.open("./assets/image_icon.png").resize((40, 40)))
+        self.cursor_icon = ImageTk.PhotoImage(image=Image.open(os.path.join(ASSETS_DIRECTORY, "cursor_icon.png")).resize((40, 40)))
+        self.move_icon = ImageTk.PhotoImage(image=Image.open(os.path.join(ASSETS_DIRECTORY, "move_icon.png")).resize((40, 40)))
+        self.zoom_icon = ImageTk.PhotoImage(image=Image.open(os.path.join(ASSETS_DIRECTORY, "zoom_icon.png")).resize((40, 40)))
+        self.hand_icon = ImageTk.PhotoImage(image=Image.open(os.path.join(ASSETS_DIRECTORY, "hand_icon.png")).resize((40, 40)))
+        self.line_icon = ImageTk.PhotoImage(image=Image.open(os.path.join(ASSETS_DIRECTORY, "line_icon.png")).resize((40, 40)))
+        self.square_icon = ImageTk.PhotoImage(image=Image.open(os.path.join(ASSETS_DIRECTORY, "square_icon.png")).resize((40, 40)))
+        self.circle_icon = ImageTk.PhotoImage(image=Image.open(os.path.join(ASSETS_DIRECTORY, "circle_icon.png")).resize((40, 40)))
+        self.polygon_icon = ImageTk.PhotoImage(image=Image.open(os.path.join(ASSETS_DIRECTORY, "polygon_icon.png")).resize((40, 40)))
+        self.pencil_icon = ImageTk.PhotoImage(image=Image.open(os.path.join(ASSETS_DIRECTORY, "pencil_icon.png")).resize((40, 40)))
+        self.eraser_icon = ImageTk.PhotoImage(image=Image.open(os.path.join(ASSETS_DIRECTORY, "eraser_icon.png")).resize((40, 40)))
+        self.text_icon = ImageTk.PhotoImage(image=Image.open(os.path.join(ASSETS_DIRECTORY, "text_icon.png")).resize((40, 40)))
+        self.image_icon = ImageTk.PhotoImage(image=Image.open(os.path.join(ASSETS_DIRECTORY, "image_icon.png")).resize((40, 40)))
 
         #? Main Widgets
         self.frame_tools_selection = ctk.CTkFrame(self, 300, 150, fg_color=self.highlight_color)
@@ -481,9 +915,59 @@ class App(ctk.CTk):
         ctk.CTkButton(self.tabview_settings.tab("Canvas Settings"), font=(self.font_name, 14), text="Change current canvas color", fg_color=self.action_color, hover_color=self.hover_action_color, text_color=self.text_color, command=self.change_canvas_color).place(relx=0.5, y=90, anchor="n")
         ctk.CTkButton(self.tabview_settings.tab("Canvas Settings"), font=(self.font_name, 14), text="Clear current canvas color", fg_color=self.action_color, hover_color=self.hover_action_color, text_color=self.text_color, command=self.clear_canvas).place(relx=0.5, y=130, anchor="n")
         ctk.CTkButton(self.tabview_settings.tab("Canvas Settings"), font=(self.font_name, 14), text="Reset current canvas view", fg_color=self.action_color, hover_color=self.hover_action_color, text_color=self.text_color, command=self.reset_canvas).place(relx=0.5, y=170, anchor="n")
+        ctk.CTkLabel(self.tabview_settings.tab("Canvas Settings"), text="Mini-map :", font=(self.font_name, 14), text_color=self.text_color).place(relx=0.1, y=210)
+        self.canvas_minimap = tk.Canvas(self.tabview_settings.tab("Canvas Settings"), width=MINIMAP_WIDTH, height=MINIMAP_HEIGHT, highlightthickness=1, highlightbackground=self.action_color, background=self.background_color)
+        self.canvas_minimap.create_image(0, 0, image=self.minimap_photo, anchor="nw", state="hidden", tags="overview")
+        self.canvas_minimap.create_rectangle(0, 0, 0, 0, outline=self.action_color, width=2, tags="viewport")
         self.entry_canvas_name.place(relx=0.1, y=10)
+        self.canvas_minimap.place(relx=0.5, y=245, anchor="n")
+
+        self.tabview_settings.add("Import / Export")
+        ctk.CTkButton(self.tabview_settings.tab("Import / Export"), font=(self.font_name, 14), text="Export current canvas to SVG", fg_color=self.action_color, hover_color=self.hover_action_color, text_color=self.text_color, command=self.export_current_canvas_svg).place(relx=0.5, y=10, anchor="n")
+        ctk.CTkButton(self.tabview_settings.tab("Import / Export"), font=(self.font_name, 14), text="Export all canvases to SVG", fg_color=self.action_color, hover_color=self.hover_action_color, text_color=self.text_color, command=self.export_all_canvases_svg).place(relx=0.5, y=50, anchor="n")
+        ctk.CTkButton(self.tabview_settings.tab("Import / Export"), font=(self.font_name, 14), text="Import SVG into current canvas", fg_color=self.action_color, hover_color=self.hover_action_color, text_color=self.text_color, command=self.import_current_canvas_svg).place(relx=0.5, y=90, anchor="n")
+        self.progress_bar_io = ctk.CTkProgressBar(self.tabview_settings.tab("Import / Export"), width=230, fg_color=self.background_color, progress_color=self.action_color)
+        self.label_io_status = ctk.CTkLabel(self.tabview_settings.tab("Import / Export"), text="", font=(self.font_name, 14), text_color=self.text_color)
+        ctk.CTkLabel(self.tabview_settings.tab("Import / Export"), text="Image format :", font=(self.font_name, 14), text_color=self.text_color).place(x=10, y=190)
+        ctk.CTkLabel(self.tabview_settings.tab("Import / Export"), text="PNG compression :", font=(self.font_name, 14), text_color=self.text_color).place(x=10, y=230)
+        self.option_menu_export_format = ctk.CTkOptionMenu(self.tabview_settings.tab("Import / Export"), values=list(EXPORT_FORMATS.keys()), font=(self.font_name, 14), fg_color=self.action_color, button_color=self.action_color, button_hover_color=self.hover_action_color, text_color=self.text_color)
+        self.slider_export_compression = ctk.CTkSlider(self.tabview_settings.tab("Import / Export"), width=110, from_=0, to=9, number_of_steps=9, button_color=self.action_color, button_hover_color=self.hover_action_color, progress_color=self.action_color, fg_color=self.background_color, command=lambda value: self.tooltip_export_compression.configure(message=str(int(value))))
+        self.tooltip_export_compression = CTkToolTip(self.slider_export_compression, message="9", bg_color=self.background_color, corner_radius=10)
+        self.switch_export_lossy_palette = ctk.CTkSwitch(self.tabview_settings.tab("Import / Export"), text="Lossy 256 colors palette", font=(self.font_name, 14), text_color=self.text_color, fg_color=self.background_color, progress_color=self.action_color, switch_height=20, switch_width=40)
+        ctk.CTkButton(self.tabview_settings.tab("Import / Export"), font=(self.font_name, 14), text="Export current canvas as image", fg_color=self.action_color, hover_color=self.hover_action_color, text_color=self.text_color, command=self.export_current_canvas_image).place(relx=0.5, y=310, anchor="n")
+        ctk.CTkButton(self.tabview_settings.tab("Import / Export"), font=(self.font_name, 14), text="Export all canvases as images", fg_color=self.action_color, hover_color=self.hover_action_color, text_color=self.text_color, command=self.export_all_canvases_image).place(relx=0.5, y=350, anchor="n")
+        ctk.CTkButton(self.tabview_settings.tab("Import / Export"), font=(self.font_name, 14), text="Compare formats", fg_color=self.action_color, hover_color=self.hover_action_color, text_color=self.text_color, command=self.compare_export_formats).place(relx=0.5, y=390, anchor="n")
+        self.label_export_report = ctk.CTkLabel(self.tabview_settings.tab("Import / Export"), text="", font=(self.font_name, 12), text_color=self.text_color, justify="left")
+        self.progress_bar_io.set(0)
+        self.progress_bar_io.place(relx=0.5, y=140, anchor="n")
+        self.label_io_status.place(relx=0.5, y=155, anchor="n")
+        self.option_menu_export_format.place(x=120, y=190)
+        self.slider_export_compression.set(9)
+        self.slider_export_compression.place(x=150, y=237)
+        self.switch_export_lossy_palette.place(x=10, y=270)
+        self.label_export_report.place(x=10, y=430)
+
+        self.tabview_settings.add("Symbols")
+        ctk.CTkLabel(self.tabview_settings.tab("Symbols"), text="Scale :", font=(self.font_name, 14), text_color=self.text_color).place(x=10, y=90)
+        ctk.CTkLabel(self.tabview_settings.tab("Symbols"), text="Rotation :", font=(self.font_name, 14), text_color=self.text_color).place(x=10, y=130)
+        self.entry_symbol_name = ctk.CTkEntry(self.tabview_settings.tab("Symbols"), font=(self.font_name, 14), width=230, placeholder_text="Symbol Name", border_color=self.hover_action_color, fg_color=self.action_color, text_color=self.text_color, placeholder_text_color=self.text_color)
+        ctk.CTkButton(self.tabview_settings.tab("Symbols"), font=(self.font_name, 14), text="Save selection as symbol", fg_color=self.action_color, hover_color=self.hover_action_color, text_color=self.text_color, command=self.save_symbol).place(relx=0.5, y=50, anchor="n")
+        self.slider_symbol_scale = ctk.CTkSlider(self.tabview_settings.tab("Symbols"), width=170, from_=0.25, to=4, number_of_steps=15, button_color=self.action_color, button_hover_color=self.hover_action_color, progress_color=self.action_color, fg_color=self.background_color, command=lambda value: self.tooltip_symbol_scale.configure(message=str(value)))
+        self.tooltip_symbol_scale = CTkToolTip(self.slider_symbol_scale, message="1.0", bg_color=self.background_color, corner_radius=10)
+        self.slider_symbol_rotation = ctk.CTkSlider(self.tabview_settings.tab("Symbols"), width=170, from_=0, to=345, number_of_steps=23, button_color=self.action_color, button_hover_color=self.hover_action_color, progress_color=self.action_color, fg_color=self.background_color, command=lambda value: self.tooltip_symbol_rotation.configure(message=str(int(value))))
+        self.tooltip_symbol_rotation = CTkToolTip(self.slider_symbol_rotation, message="0", bg_color=self.background_color, corner_radius=10)
+        self.option_menu_symbol = ctk.CTkOptionMenu(self.tabview_settings.tab("Symbols"), values=["No symbol"], font=(self.font_name, 14), fg_color=self.action_color, button_color=self.action_color, button_hover_color=self.hover_action_color, text_color=self.text_color)
+        self.switch_symbol_stamp = ctk.CTkSwitch(self.tabview_settings.tab("Symbols"), text="Stamp with cursor tool", font=(self.font_name, 14), text_color=self.text_color, fg_color=self.background_color, progress_color=self.action_color, switch_height=20, switch_width=40)
+        self.entry_symbol_name.place(relx=0.5, y=10, anchor="n")
+        self.slider_symbol_scale.set(1)
+        self.slider_symbol_scale.place(x=90, y=97)
+        self.slider_symbol_rotation.set(0)
+        self.slider_symbol_rotation.place(x=90, y=137)
+        self.option_menu_symbol.place(relx=0.5, y=170, anchor="n")
+        self.switch_symbol_stamp.place(x=10, y=210)
 
         self.tabview_settings.add("Settings")
+        ctk.CTkButton(self.tabview_settings.tab("Settings"), font=(self.font_name, 14), text="Add custom fill pattern", fg_color=self.action_color, hover_color=self.hover_action_color, text_color=self.text_color, command=self.add_custom_pattern).place(relx=0.5, y=10, anchor="n")
 
         #? Binding
         self.bind("<Escape>", lambda _:self.quit()) #! To remove
@@ -508,14 +992,23 @@ class App(ctk.CTk):
         self.bind("<Alt-Key-BackSpace>", lambda _: self.radiobutton_cursor.invoke())
         self.bind("<Control-z>", lambda _: self.crtl_z())
 
+        self.tabview_canvas.configure(command=self.schedule_minimap_update)
+        self.canvas_minimap.bind("<Button-1>", self.minimap_jump)
+        self.canvas_minimap.bind("<B1-Motion>", self.minimap_jump)
+
         self.entry_canvas_name.bind("<Return>", lambda _: self.add_canvas())
         self.entry_canvas_name.bind("<KeyRelease>", lambda _: self.cap_entry(self.entry_canvas_name, 10))
+        self.entry_symbol_name.bind("<Return>", lambda _: self.save_symbol())
         self.entry_text.bind("<Return>", lambda _: self.focus_set())
         self.entry_image_width.bind("<Return>", lambda _: self.focus_set())
         self.entry_image_height.bind("<Return>", lambda _: self.focus_set())
         self.entry_image_width.bind("<KeyRelease>", lambda _: self.cap_entry_to_int(self.entry_image_width, 4))
         self.entry_image_height.bind("<KeyRelease>", lambda _: self.cap_entry_to_int(self.entry_image_height, 4))
 
+        #? Tcl Procedures
+        self.tk.eval(BULK_CREATE_PROC)
+        self.tk.eval(MINIMAP_REGION_PROC)
+
         #? Mainloop
         self.mainloop()
 
@@ -524,17 +1017,24 @@ class App(ctk.CTk):
             current_canvas = self.tabview_canvas.tab(self.tabview_canvas.get()).children.get("!canvas")
             if current_canvas == event.widget:
                 self.start_x, self.start_y = current_canvas.canvasx(event.x), current_canvas.canvasy(event.y)
-                if self.selected_tool.get() == MOVE:
+                if self.selected_tool.get() == CURSOR:
+                    if self.switch_symbol_stamp.get() and self.option_menu_symbol.get() in self.symbols:
+                        self.place_symbol(current_canvas, self.option_menu_symbol.get(), self.start_x, self.start_y)
+                elif self.selected_tool.get() == MOVE:
                     current_canvas.scan_mark(event.x, event.y)
                 elif self.selected_tool.get() == ZOOM:
                     factor = 1.1
                     current_canvas.scale("all", self.start_x, self.start_y, factor, factor)
+                    self.scale_minimap(current_canvas, self.start_x, self.start_y, factor)
+                    self.scale_symbol_instances(current_canvas, self.start_x, self.start_y, factor)
+                    self.scale_image_items(current_canvas, factor)
+                    self.scale_text_items(current_canvas, factor)
                 elif self.selected_tool.get() == HAND:
                     selected = current_canvas.find_overlapping(self.start_x - 1, self.start_y - 1, self.start_x + 1, self.start_y + 1)
-                    if selected and not any([True for tag in current_canvas.gettags(selected[-1]) if "line" in tag]):
+                    if selected and self.get_group_tag(current_canvas, selected[-1]) is None:
                         self.selected_canvas_item = selected[-1]
                     elif selected:
-                        self.selected_canvas_item = current_canvas.find_withtag(current_canvas.gettags(selected[-1]))
+                        self.selected_canvas_item = current_canvas.find_withtag(self.get_group_tag(current_canvas, selected[-1]))
                     else:
                         self.selected_canvas_item = None
                 elif self.selected_tool.get() == LINE:
@@ -546,10 +1046,14 @@ class App(ctk.CTk):
                     self.draw_polygon(current_canvas, self.polygon_points, True)
                 elif self.selected_tool.get() == ERASER:
                     selected = current_canvas.find_overlapping(self.start_x - 1, self.start_y - 1, self.start_x + 1, self.start_y + 1)
-                    if selected and not any([True for tag in current_canvas.gettags(selected[-1]) if "line" in tag]):
+                    if selected and self.get_group_tag(current_canvas, selected[-1]) is None:
+                        self.mark_minimap_dirty(current_canvas, selected[-1])
                         current_canvas.delete(selected[-1])
                     elif selected:
-                        current_canvas.delete(current_canvas.gettags(selected[-1])[0])
+                        tag = self.get_group_tag(current_canvas, selected[-1])
+                        self.mark_minimap_dirty(current_canvas, tag)
+                        current_canvas.delete(tag)
+                    self.prune_text_groups()
                 elif self.selected_tool.get() == TEXT:
                     self.draw_text(current_canvas)
                 elif self.selected_tool.get() == IMAGE:
@@ -563,6 +1067,10 @@ class App(ctk.CTk):
                 if self.selected_tool.get() == ZOOM:
                     factor = 0.9
                     current_canvas.scale("all", self.start_x, self.start_y, factor, factor)
+                    self.scale_minimap(current_canvas, self.start_x, self.start_y, factor)
+                    self.scale_symbol_instances(current_canvas, self.start_x, self.start_y, factor)
+                    self.scale_image_items(current_canvas, factor)
+                    self.scale_text_items(current_canvas, factor)
 
     def lmb_motion(self, event)-> None:
         if self.tabview_canvas.get() != '':
@@ -570,24 +1078,32 @@ class App(ctk.CTk):
             if current_canvas == event.widget:
                 x, y = current_canvas.canvasx(event.x), current_canvas.canvasy(event.y)
                 current_canvas.delete("delete")
-                if self.selected_tool.get() == MOVE:
+                if self.selected_tool.get() == CURSOR and not self.switch_symbol_stamp.get():
+                    current_canvas.create_rectangle(self.start_x, self.start_y, x, y, outline=self.action_color, dash=(3, 5), tags="delete")
+                elif self.selected_tool.get() == MOVE:
                     current_canvas.scan_dragto(event.x, event.y, gain=1)
+                    self.schedule_minimap_update()
                 elif self.selected_tool.get() == HAND:
                     if self.selected_canvas_item != -1 and isinstance(self.selected_canvas_item, int):
                         dx, dy = x - self.start_x, y - self.start_y
+                        self.mark_minimap_dirty(current_canvas, self.selected_canvas_item)
                         current_canvas.move(self.selected_canvas_item, dx, dy)
+                        self.mark_minimap_dirty(current_canvas, self.selected_canvas_item)
                         self.lmb_click(event)
                     elif isinstance(self.selected_canvas_item, (tuple, list)):
                         dx, dy = x - self.start_x, y - self.start_y
+                        self.mark_minimap_dirty(current_canvas, *self.selected_canvas_item)
                         for item in self.selected_canvas_item:
                             current_canvas.move(item, dx, dy)
+                        self.mark_minimap_dirty(current_canvas, *self.selected_canvas_item)
                         self.lmb_click(event)
                 elif self.selected_tool.get() == SQUARE:
                     self.draw_square(current_canvas, x, y, True)
                 elif self.selected_tool.get() == CIRCLE:
                     self.draw_circle(current_canvas, x, y, True)
                 elif self.selected_tool.get() == PENCIL:
-                    current_canvas.create_line((self.start_x, self.start_y, x, y), width=self.slider_pencil_thickness.get(), capstyle="round", smooth=True, fill=self.button_pencil_color.cget("fg_color"), tags=(self.current_line_number))
+                    l = current_canvas.create_line((self.start_x, self.start_y, x, y), width=self.slider_pencil_thickness.get(), capstyle="round", smooth=True, fill=self.button_pencil_color.cget("fg_color"), tags=(self.current_line_number))
+                    self.mark_minimap_dirty(current_canvas, l)
                     self.lmb_click(event)
 
     def lmb_release(self, event)-> None:
@@ -595,7 +1111,11 @@ class App(ctk.CTk):
             current_canvas = self.tabview_canvas.tab(self.tabview_canvas.get()).children.get("!canvas")
             if current_canvas == event.widget:
                 x, y = current_canvas.canvasx(event.x), current_canvas.canvasy(event.y)
-                if self.selected_tool.get() == SQUARE:
+                if self.selected_tool.get() == CURSOR and not self.switch_symbol_stamp.get():
+                    self.select_items(current_canvas, x, y)
+                elif self.selected_tool.get() == MOVE:
+                    self.refresh_cropped_images(current_canvas)
+                elif self.selected_tool.get() == SQUARE:
                     self.draw_square(current_canvas, x, y)
                 elif self.selected_tool.get() == CIRCLE:
                     self.draw_circle(current_canvas, x, y)
@@ -636,6 +1156,7 @@ class App(ctk.CTk):
         l = canvas.create_line(points, fill=self.button_line_color.cget("fg_color"), width=self.slider_line_thickness.get(), capstyle=capstyle, smooth=self.switch_line_smooth.get(), dash=dash, arrow=arrow, arrowshape=(12, 15, 4.5), stipple=pattern, offset=tk.NW, tags=tag)
         if not delete:
             self.crtl_z_items.append(l)
+            self.mark_minimap_dirty(canvas, l)
 
     def draw_square(self, canvas, x:int, y:int, delete:bool=False)-> None:
         dash = (3, 5) if self.option_menu_square_outline_style.get() == "Dashed" else ()
@@ -649,6 +1170,7 @@ class App(ctk.CTk):
         r = canvas.create_rectangle((self.start_x, self.start_y, x, y), outline=self.button_square_outline_color.cget("fg_color"), width=self.slider_square_thickness.get(), dash=dash, fill=fill, stipple=pattern, offset=tk.NW, tags=tag)
         if not delete:
             self.crtl_z_items.append(r)
+            self.mark_minimap_dirty(canvas, r)
 
     def draw_circle(self, canvas, x:int, y:int, delete:bool=False)-> None:
         dash = (3, 5) if self.option_menu_circle_outline_style.get() == "Dashed" else ()
@@ -661,6 +1183,7 @@ class App(ctk.CTk):
         c = canvas.create_oval(self.start_x, self.start_y, x, y, outline=self.button_circle_outline_color.cget("fg_color"), width=self.slider_circle_thickness.get(), dash=dash, fill=fill, tags=tag)
         if not delete:
             self.crtl_z_items.append(c)
+            self.mark_minimap_dirty(canvas, c)
 
     def draw_polygon(self, canvas, points:list, delete:bool=False)-> None:
         dash = (3, 5) if self.option_menu_polygon_outline_style.get() == "Dashed" else ()
@@ -670,21 +1193,48 @@ class App(ctk.CTk):
         p = canvas.create_polygon(points, outline=self.button_polygon_outline_color.cget("fg_color"), smooth=self.switch_polygon_smooth.get(), width=self.slider_polygon_thickness.get(), dash=dash, fill=fill, stipple=pattern, tags=tag)
         if not delete:
             self.crtl_z_items.append(p)
+            self.mark_minimap_dirty(canvas, p)
 
     def draw_text(self, canvas)-> None:
-        t = canvas.create_text(self.start_x, self.start_y, text=self.entry_text.get(), font=(self.option_menu_text_font.get(), int(self.slider_text_size.get())), fill=self.button_text_color.cget("fg_color"), anchor=self.anchors_dict.get(self.option_menu_text_anchor.get()))
+        t = canvas.create_text(self.start_x, self.start_y, text=self.entry_text.get(), font=self.get_font(self.option_menu_text_font.get(), int(self.slider_text_size.get())), fill=self.button_text_color.cget("fg_color"), anchor=self.anchors_dict.get(self.option_menu_text_anchor.get()))
         self.crtl_z_items.append(t)
+        self.register_text_items(canvas, [t], self.option_menu_text_font.get(), int(self.slider_text_size.get()))
+        self.mark_minimap_dirty(canvas, t)
 
     def draw_image(self, canvas)-> None:
         if len(self.images) > 0:
             anchor = self.anchors_dict.get(self.option_menu_image_anchor.get())
             i = canvas.create_image(self.start_x, self.start_y, image=self.images[self.current_image_index], anchor=anchor)
             self.crtl_z_items.append(i)
+            self.register_image_item(canvas, i, self.images[self.current_image_index], anchor)
+            self.mark_minimap_dirty(canvas, i)
+
+    def create_shapes(self, kind:str, coords_list, canvas=None, undo:bool=True, **options)-> list:
+        if canvas is None:
+            if self.tabview_canvas.get() == '':
+                return []
+            canvas = self.tabview_canvas.tab(self.tabview_canvas.get()).children.get("!canvas")
+
+        bulk_tag = "bulk_" + str(self.bulk_number)
+        self.bulk_number += 1
+        user_tags = options.pop("tags", ())
+        ids = bulk_create(canvas, kind, coords_list, (bulk_tag,) + ((user_tags,) if isinstance(user_tags, str) else tuple(user_tags)), options)
+
+        if ids:
+            if kind == "text":
+                self.register_text_items(canvas, [bulk_tag], *self.get_font_spec(canvas, options.get("font", "TkDefaultFont")))
+            if undo:
+                self.crtl_z_items.append(bulk_tag)
+            self.mark_minimap_dirty(canvas, bulk_tag)
+        return ids
 
     def crtl_z(self)-> None:
         if len(self.crtl_z_items) > 0 and self.tabview_canvas.get() != '':
             current_canvas = self.tabview_canvas.tab(self.tabview_canvas.get()).children.get("!canvas")
-            current_canvas.delete(self.crtl_z_items.pop(-1))
+            item = self.crtl_z_items.pop(-1)
+            self.mark_minimap_dirty(current_canvas, item)
+            current_canvas.delete(item)
+            self.prune_text_groups()
 
     def key_press(self, event)-> None:
         self.pressed_special_keys.add(event.keysym)
@@ -715,9 +1265,28 @@ class App(ctk.CTk):
         path = askopenfilename(title=self.title_name, filetypes=[("Image files", "*.png;*.jpg;*.jpeg;")])
         if path and self.entry_image_width.get() and self.entry_image_height.get():
             if int(self.entry_image_width.get()) > 0 and int(self.entry_image_height.get()) > 0:
+                width, height = int(self.entry_image_width.get()), int(self.entry_image_height.get())
+                try:
+                    preview = self.get_image_preview(path, width, height)
+                except OSError:
+                    self.show_error(message="This image file could not be read")
+                    return
                 self.button_image_path.configure(text=path.split("/")[-1])
-                self.images.append(ImageTk.PhotoImage(image=Image.open(path).resize((int(self.entry_image_width.get()), int(self.entry_image_height.get())))))
+                self.images.append(ImageTk.PhotoImage(image=preview))
+                self.image_sources[str(self.images[-1])] = preview
+                self.image_pyramid_keys[str(self.images[-1])] = os.path.abspath(path)
                 self.current_image_index = len(self.images) - 1
+                self.image_loads[str(self.images[-1])] = (self.images[-1], self.image_executor.submit(self.render_pyramid_image, os.path.abspath(path), width, height, None))
+                if not self.image_poll_pending:
+                    self.image_poll_pending = True
+                    self.after(IMAGE_POLL_DELAY, self.poll_image_jobs)
+
+    def get_image_preview(self, path:str, width:int, height:int):
+        with Image.open(path) as source:
+            if source.format == "JPEG":
+                source.draft(source.mode, (width, height))
+                return source.convert("RGB").resize((width, height), Image.BILINEAR)
+        return Image.new("RGBA", (width, height), IMAGE_PLACEHOLDER_COLOR)
 
     def place_options(self, frame=None)-> None:
         self.frame_line_options.place_forget()
@@ -730,6 +1299,7 @@ class App(ctk.CTk):
         self.frame_image_options.place_forget()
 
         self.polygon_points = []
+        self.clear_selection()
 
         if frame:
             frame.place(x=5, y=193)
@@ -785,6 +1355,7 @@ class App(ctk.CTk):
                 new_canvas = tk.Canvas(self.tabview_canvas.tab(canvas_name), width=950, height=810, highlightthickness=0, background="#FFFFFF")
                 new_canvas.place(relx=0.5, y=-5, anchor="n")
                 self.tabview_canvas.set(canvas_name)
+                self.schedule_minimap_update()
                 self.canvas_number += 1
                 self.entry_canvas_name.delete("0", "end")
                 self.focus_set()
@@ -813,6 +1384,7 @@ class App(ctk.CTk):
         if self.ask_yes_no("Are you sure you want to delete this canvas ?"):
             self.tabview_canvas.delete(self.tabview_canvas.get())
             self.canvas_number -= 1
+            self.schedule_minimap_update()
 
     def change_canvas_color(self)-> None:
         if self.canvas_number == 0:
@@ -829,6 +1401,8 @@ class App(ctk.CTk):
         
         if self.ask_yes_no("Are you sure you want to clear this canvas ?"):
             self.tabview_canvas.tab(self.tabview_canvas.get()).children.get("!canvas").delete("all")
+            self.minimap_source = None
+            self.schedule_minimap_update()
 
     def reset_canvas(self)-> None:
         if self.canvas_number == 0:
@@ -839,7 +1413,1105 @@ class App(ctk.CTk):
             current_canvas = self.tabview_canvas.tab(self.tabview_canvas.get()).children.get("!canvas")
             current_canvas.xview_moveto(0.0)
             current_canvas.yview_moveto(0.0)
+            self.schedule_minimap_update()
+
+    def get_drawing_items(self, canvas)-> list:
+        return [item for item in canvas.find_all() if not {"delete", "selection"} & set(canvas.gettags(item))]
+
+    def get_group_tag(self, canvas, item)-> str:
+        for tag in canvas.gettags(item):
+            if "line" in tag or tag in self.symbol_instances:
+                return tag
+        return None
+
+    def get_font_spec(self, canvas, font)-> tuple:
+        if str(font) not in self.font_specs:
+            self.font_specs[str(font)] = (canvas.tk.call("font", "actual", font, "-family"), int(canvas.tk.call("font", "actual", font, "-size")))
+        return self.font_specs[str(font)]
+
+    def resolve_font_family(self, family:str)-> str:
+        if family not in self.resolved_fonts:
+            if self.available_fonts is None:
+                self.available_fonts = {available.lower(): available for available in tkfont.families(self)}
+            candidates = [family] + FONT_FALLBACKS
+            self.resolved_fonts[family] = next((self.available_fonts[candidate.lower()] for candidate in candidates if candidate.lower() in self.available_fonts), tkfont.nametofont("TkDefaultFont").actual("family"))
+        return self.resolved_fonts[family]
+
+    def get_font(self, family:str, size:int):
+        key = (self.resolve_font_family(family), size)
+        if key not in self.fonts:
+            self.fonts[key] = tkfont.Font(self, family=key[0], size=size)
+        return self.fonts[key]
+
+    def register_text_items(self, canvas, items:list, family:str, size:int)-> None:
+        tag = next((tag for tag, group in self.text_groups.items() if group["canvas"] is canvas and (group["family"], group["size"], group["scale"]) == (family, size, 1.0)), None)
+        if tag is None:
+            tag = "text_" + str(self.bulk_number)
+            self.bulk_number += 1
+            self.text_groups[tag] = {"canvas": canvas, "family": family, "size": size, "scale": 1.0, "font": self.get_font(family, size)}
+        for item in items:
+            canvas.addtag_withtag(tag, item)
+
+    def scale_text_items(self, canvas, factor:float)-> None:
+        for tag, group in self.text_groups.items():
+            if group["canvas"] is not canvas:
+                continue
+            group["scale"] *= factor
+            font = self.get_font(group["family"], round(group["size"] * group["scale"]) or (1 if group["size"] > 0 else -1))
+            if font is not group["font"]:
+                canvas.itemconfigure(tag, font=font)
+                group["font"] = font
+
+    def prune_text_groups(self)-> None:
+        for tag, group in list(self.text_groups.items()):
+            if not group["canvas"].winfo_exists() or not group["canvas"].find_withtag(tag):
+                del self.text_groups[tag]
+
+    def measure_text(self, text:str, family:str, size:int)-> tuple:
+        key = (text, self.resolve_font_family(family), size)
+        if key not in self.text_extents:
+            font = self.get_font(family, size)
+            lines = text.split("\n")
+            self.text_extents[key] = (max(font.measure(line) for line in lines), font.metrics("linespace") * len(lines))
+        return self.text_extents[key]
+
+    def get_canvas_viewport(self, canvas)-> tuple:
+        left = max(0, -canvas.winfo_x())
+        top = max(0, -canvas.winfo_y())
+        right = min(canvas.winfo_width(), canvas.master.winfo_width() - canvas.winfo_x())
+        bottom = min(canvas.winfo_height(), canvas.master.winfo_height() - canvas.winfo_y())
+        return (canvas.canvasx(left), canvas.canvasy(top), canvas.canvasx(right), canvas.canvasy(bottom))
+
+    def world_to_minimap(self, x:float, y:float)-> tuple:
+        return ((x - self.minimap_origin[0]) * self.minimap_scale, (y - self.minimap_origin[1]) * self.minimap_scale)
+
+    def minimap_to_world(self, x:float, y:float)-> tuple:
+        return (x / self.minimap_scale + self.minimap_origin[0], y / self.minimap_scale + self.minimap_origin[1])
+
+    def mark_minimap_dirty(self, canvas, *items)-> None:
+        if canvas is self.minimap_source and items:
+            bbox = canvas.bbox(*items)
+            if bbox:
+                self.minimap_dirty.append(bbox)
+                self.schedule_minimap_update()
+
+    def schedule_minimap_update(self)-> None:
+        if not self.minimap_update_pending:
+            self.minimap_update_pending = True
+            self.after_idle(self.update_minimap)
+
+    def scale_minimap(self, canvas, x:float, y:float, factor:float)-> None:
+        if canvas is self.minimap_source:
+            self.minimap_scale /= factor
+            self.minimap_origin = (x + factor * (self.minimap_origin[0] - x), y + factor * (self.minimap_origin[1] - y))
+        self.schedule_minimap_update()
+
+    def update_minimap(self)-> None:
+        self.minimap_update_pending = False
+        current_canvas = self.tabview_canvas.tab(self.tabview_canvas.get()).children.get("!canvas") if self.tabview_canvas.get() != '' else None
+
+        if current_canvas is not self.minimap_source:
+            self.minimap_source = current_canvas
+            self.minimap_full_render = True
+            if current_canvas is None:
+                self.canvas_minimap.itemconfigure("overview", state="hidden")
+                self.canvas_minimap.coords("viewport", 0, 0, 0, 0)
+                return
+
+        viewport = self.get_canvas_viewport(current_canvas)
+        if self.fit_minimap(current_canvas.bbox("all"), viewport) or len(self.minimap_dirty) > MINIMAP_REGION_LIMIT:
+            self.minimap_full_render = True
+
+        if self.minimap_full_render:
+            self.render_minimap_region((0, 0, MINIMAP_WIDTH, MINIMAP_HEIGHT))
+        else:
+            for left, top, right, bottom in self.minimap_dirty:
+                mini_left, mini_top = self.world_to_minimap(left, top)
+                mini_right, mini_bottom = self.world_to_minimap(right, bottom)
+                self.render_minimap_region((math.floor(mini_left) - 1, math.floor(mini_top) - 1, math.ceil(mini_right) + 1, math.ceil(mini_bottom) + 1))
+        if self.minimap_full_render or self.minimap_dirty:
+            self.minimap_photo.paste(self.minimap_image)
+        self.minimap_dirty = []
+        self.minimap_full_render = False
+
+        self.canvas_minimap.itemconfigure("overview", state="normal")
+        self.canvas_minimap.coords("viewport", *self.world_to_minimap(*viewport[:2]), *self.world_to_minimap(*viewport[2:]))
+
+    def fit_minimap(self, content_bbox, viewport:tuple)-> bool:
+        left, top, right, bottom = viewport
+        if content_bbox:
+            left, top = min(left, content_bbox[0]), min(top, content_bbox[1])
+            right, bottom = max(right, content_bbox[2]), max(bottom, content_bbox[3])
+
+        shown_left, shown_top = self.minimap_origin
+        shown_right, shown_bottom = self.minimap_to_world(MINIMAP_WIDTH, MINIMAP_HEIGHT)
+        scale = min((MINIMAP_WIDTH - 2 * MINIMAP_PADDING) / max(right - left, 1), (MINIMAP_HEIGHT - 2 * MINIMAP_PADDING) / max(bottom - top, 1))
+        if shown_left <= left and shown_top <= top and right <= shown_right and bottom <= shown_bottom and scale < 2 * self.minimap_scale:
+            return False
+
+        self.minimap_scale = scale
+        self.minimap_origin = ((left + right) / 2 - MINIMAP_WIDTH / scale / 2, (top + bottom) / 2 - MINIMAP_HEIGHT / scale / 2)
+        return True
+
+    def render_minimap_region(self, box:tuple)-> None:
+        canvas = self.minimap_source
+        left, top = max(0, box[0]), max(0, box[1])
+        right, bottom = min(MINIMAP_WIDTH, box[2]), min(MINIMAP_HEIGHT, box[3])
+        if right <= left or bottom <= top:
+            return
+
+        tile = Image.new("RGB", (right - left, bottom - top), self.svg_color(canvas, canvas.cget("background")))
+        draw = ImageDraw.Draw(tile)
+        world_left, world_top = self.minimap_to_world(left, top)
+        world_right, world_bottom = self.minimap_to_world(right, bottom)
+        entries = canvas.tk.splitlist(canvas.tk.call("::colorful_region_items", canvas._w, world_left, world_top, world_right, world_bottom))
+
+        for index in range(0, len(entries), 4):
+            item_type, points, fill, outline = entries[index:index + 4]
+            points = [float(value) for value in canvas.tk.splitlist(points)]
+            coords = [((points[point] - self.minimap_origin[0]) * self.minimap_scale - left, (points[point + 1] - self.minimap_origin[1]) * self.minimap_scale - top) for point in range(0, len(points) - 1, 2)]
+            if len(coords) < 2:
+                continue
+            fill = self.svg_color(canvas, fill) if fill else None
+            outline = self.svg_color(canvas, outline) if outline else None
+            if item_type == "line":
+                draw.line(coords, fill=fill)
+            elif item_type == "polygon":
+                draw.polygon(coords, fill=fill, outline=outline)
+            else:
+                (x0, y0), (x1, y1) = coords[0], coords[-1]
+                box_coords = (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+                if item_type == "rectangle":
+                    draw.rectangle(box_coords, fill=fill, outline=outline)
+                elif item_type == "oval":
+                    draw.ellipse(box_coords, fill=fill, outline=outline)
+                else:
+                    draw.rectangle(box_coords, fill=fill or "#A0A0A0")
+
+        self.minimap_image.paste(tile, (left, top))
+
+    def minimap_jump(self, event)-> None:
+        if self.minimap_source is None or not self.minimap_source.winfo_exists():
+            return
+
+        x, y = self.minimap_to_world(event.x, event.y)
+        left, top, right, bottom = self.get_canvas_viewport(self.minimap_source)
+        self.minimap_source.scan_mark(0, 0)
+        self.minimap_source.scan_dragto(round((left + right) / 2 - x), round((top + bottom) / 2 - y), gain=1)
+        self.refresh_cropped_images(self.minimap_source)
+        self.schedule_minimap_update()
+
+    def set_io_progress(self, value:float, message:str="")-> None:
+        self.progress_bar_io.set(value)
+        self.label_io_status.configure(text=message)
+        self.update_idletasks()
+
+    def svg_color(self, canvas, color:str)-> str:
+        if not color:
+            return "none"
+        if color not in self.svg_colors:
+            self.svg_colors[color] = "#%02x%02x%02x" % tuple(value // 256 for value in canvas.winfo_rgb(color))
+        return self.svg_colors[color]
+
+    def svg_pattern(self, canvas, file, stipple:str, color:str, patterns:dict)-> str:
+        if not stipple or stipple in STIPPLE_OPACITIES:
+            return self.svg_color(canvas, color)
+        key = (stipple, color)
+        if key not in patterns:
+            patterns[key] = "pattern_" + str(len(patterns))
+            width, height, rows = self.get_pattern_bits(stipple)
+            file.write(f'<defs><pattern id="{patterns[key]}" patternUnits="userSpaceOnUse" width="{width}" height="{height}">')
+            for y, row in enumerate(rows):
+                x = 0
+                while x < width:
+                    if row[x]:
+                        start = x
+                        while x < width and row[x]:
+                            x += 1
+                        file.write(f'<rect x="{start}" y="{y}" width="{x - start}" height="1" fill="{self.svg_color(canvas, color)}"/>')
+                    x += 1
+            file.write("</pattern></defs>\n")
+        return f"url(#{patterns[key]})"
+
+    def svg_smooth_path(self, points:list, closed:bool)-> str:
+        pairs = [(points[index], points[index + 1]) for index in range(0, len(points) - 1, 2)]
+        start, segments = get_smooth_segments(pairs, closed)
+        data = [f"M{start[0]:g},{start[1]:g}"]
+        data.extend(f"Q{control[0]:g},{control[1]:g} {end[0]:g},{end[1]:g}" for control, end in segments)
+        if len(pairs) == 2:
+            data.append(f"L{pairs[1][0]:g},{pairs[1][1]:g}")
+        return " ".join(data) + (" Z" if closed else "")
+
+    def svg_arrow(self, tip:tuple, tail:tuple, width:float, color:str, shape:tuple)-> str:
+        return f'<polygon points="{" ".join(f"{x:g},{y:g}" for x, y in get_arrow_points(tip, tail, width, shape))}" fill="{color}"/>\n'
+
+    def svg_element(self, canvas, file, item, patterns:dict, images:dict)-> str:
+        item_type = canvas.type(item)
+        options = {option: canvas.itemcget(item, option) for option in SYMBOL_OPTIONS.get(item_type, ())}
+        return self.svg_shape(canvas, file, item_type, canvas.coords(item), options, patterns, images)
+
+    def svg_shape(self, canvas, file, item_type:str, coords:list, options:dict, patterns:dict, images:dict)-> str:
+        if item_type == "text":
+            family, size = self.get_font_spec(canvas, options["font"])
+            anchor = options["anchor"]
+            text_anchor = "start" if "w" in anchor else "end" if "e" in anchor else "middle"
+            baseline = "text-before-edge" if anchor.startswith("n") else "text-after-edge" if anchor.startswith("s") else "central"
+            font_size = f"{size}pt" if size > 0 else f"{-size}px"
+            angle = float(options.get("angle") or 0) % 360
+            rotate = f' transform="rotate({-angle:g} {coords[0]:g} {coords[1]:g})"' if angle else ""
+            return f'<text x="{coords[0]:g}" y="{coords[1]:g}"{rotate} font-family={quoteattr(family)} font-size="{font_size}" text-anchor="{text_anchor}" dominant-baseline="{baseline}" fill="{self.svg_color(canvas, options["fill"])}" xml:space="preserve">{escape(options["text"])}</text>\n'
+
+        if item_type == "image":
+            name = str(options["image"])
+            source = self.image_sources.get(name)
+            if source is None:
+                return ""
+            if name not in images:
+                buffer = io.BytesIO()
+                source.save(buffer, format="PNG")
+                images[name] = base64.b64encode(buffer.getvalue()).decode("ascii")
+            offset_x, offset_y = self.get_anchor_offset(options["anchor"], source.width, source.height)
+            return f'<image x="{coords[0] - offset_x:g}" y="{coords[1] - offset_y:g}" width="{source.width}" height="{source.height}" preserveAspectRatio="none" xlink:href="data:image/png;base64,{images[name]}"/>\n'
+
+        width = float(options["width"])
+        dash = re.findall(SVG_NUMBER, str(options["dash"]))
+        stroke_style = f' stroke-width="{width:g}"' + (f' stroke-dasharray="{" ".join(dash)}"' if dash else "")
+        stipple = options.get("stipple", "")
+        opacity = STIPPLE_OPACITIES.get(stipple)
+        smooth = str(options.get("smooth", "0")) not in ("0", "false", "") and len(coords) > 4
+
+        if item_type == "line":
+            fill = options["fill"]
+            stroke = self.svg_pattern(canvas, file, stipple, fill, patterns)
+            capstyle = {"projecting": "square"}.get(options["capstyle"], options["capstyle"])
+            opacity_style = f' stroke-opacity="{opacity}"' if opacity else ""
+            if smooth:
+                element = f'<path d="{self.svg_smooth_path(coords, False)}" fill="none" stroke="{stroke}"{stroke_style} stroke-linecap="{capstyle}"{opacity_style}/>\n'
+            else:
+                element = f'<polyline points="{" ".join(f"{value:g}" for value in coords)}" fill="none" stroke="{stroke}"{stroke_style} stroke-linecap="{capstyle}"{opacity_style}/>\n'
+            arrowshape = [float(value) for value in re.findall(SVG_NUMBER, str(options["arrowshape"]))]
+            if options["arrow"] in ("last", "both"):
+                element += self.svg_arrow((coords[-2], coords[-1]), (coords[-4], coords[-3]), width, self.svg_color(canvas, fill), arrowshape)
+            if options["arrow"] in ("first", "both"):
+                element += self.svg_arrow((coords[0], coords[1]), (coords[2], coords[3]), width, self.svg_color(canvas, fill), arrowshape)
+            return element
+
+        fill = self.svg_pattern(canvas, file, stipple, options["fill"], patterns)
+        shape_style = f'fill="{fill}"' + (f' fill-opacity="{opacity}"' if opacity else "") + f' stroke="{self.svg_color(canvas, options["outline"])}"' + (stroke_style if width else ' stroke-width="0"')
+
+        if item_type == "rectangle":
+            return f'<rect x="{min(coords[0], coords[2]):g}" y="{min(coords[1], coords[3]):g}" width="{abs(coords[2] - coords[0]):g}" height="{abs(coords[3] - coords[1]):g}" {shape_style}/>\n'
+        if item_type == "oval":
+            return f'<ellipse cx="{(coords[0] + coords[2]) / 2:g}" cy="{(coords[1] + coords[3]) / 2:g}" rx="{abs(coords[2] - coords[0]) / 2:g}" ry="{abs(coords[3] - coords[1]) / 2:g}" {shape_style}/>\n'
+        if item_type == "polygon":
+            if smooth:
+                return f'<path d="{self.svg_smooth_path(coords, True)}" {shape_style}/>\n'
+            return f'<polygon points="{" ".join(f"{value:g}" for value in coords)}" {shape_style}/>\n'
+        return ""
+
+    def export_canvas_svg(self, canvas, path:str)-> None:
+        items = [item for item in self.get_drawing_items(canvas) if canvas.itemcget(item, "state") != "hidden"]
+        left, top, right, bottom = (canvas.bbox(*items) if items else None) or (0, 0, canvas.winfo_width(), canvas.winfo_height())
+        patterns, images = {}, {}
+
+        with open(path, "w", encoding="utf-8") as file:
+            file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            file.write(f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="{right - left}" height="{bottom - top}" viewBox="{left} {top} {right - left} {bottom - top}">\n')
+            file.write(f'<rect x="{left}" y="{top}" width="{right - left}" height="{bottom - top}" fill="{self.svg_color(canvas, canvas.cget("background"))}"/>\n')
+            for index, item in enumerate(items):
+                tag = self.get_group_tag(canvas, item)
+                if tag in self.symbol_instances and self.symbol_instances[tag]["item"] == item:
+                    for item_type, coords, options in self.get_instance_shapes(tag):
+                        file.write(self.svg_shape(canvas, file, item_type, coords, options, patterns, images))
+                else:
+                    file.write(self.svg_element(canvas, file, item, patterns, images))
+                if index % SVG_PROGRESS_STEP == 0:
+                    self.set_io_progress(index / len(items), f"Exporting {os.path.basename(path)}...")
+            file.write("</svg>\n")
+
+        self.set_io_progress(1, f"Exported {os.path.basename(path)}")
+
+    def export_current_canvas_svg(self)-> None:
+        if self.canvas_number == 0:
+            self.show_error("There is no canvas to export")
+            return
+
+        path = asksaveasfilename(title=self.title_name, defaultextension=".svg", initialfile=self.tabview_canvas.get() + ".svg", filetypes=[("SVG files", "*.svg")])
+        if path:
+            self.export_canvas_svg(self.tabview_canvas.tab(self.tabview_canvas.get()).children.get("!canvas"), path)
+
+    def export_all_canvases_svg(self)-> None:
+        if self.canvas_number == 0:
+            self.show_error("There is no canvas to export")
+            return
+
+        directory = askdirectory(title=self.title_name)
+        if directory:
+            for canvas_name in self.tabview_canvas._tab_dict:
+                self.export_canvas_svg(self.tabview_canvas.tab(canvas_name).children.get("!canvas"), os.path.join(directory, canvas_name + ".svg"))
+
+    def export_canvases_image(self, canvases:list, directory:str=None, image_formats:list=None)-> None:
+        image_formats = image_formats or [self.option_menu_export_format.get()]
+        compress_level = int(self.slider_export_compression.get())
+        lossy_palette = bool(self.switch_export_lossy_palette.get())
+        jobs = []
+
+        for index, (canvas_name, canvas) in enumerate(canvases):
+            self.set_io_progress(index / len(canvases) / 2, f"Rendering {canvas_name}...")
+            image = self.render_canvas_image(canvas)
+            for image_format in image_formats:
+                path = os.path.join(directory, canvas_name + EXPORT_FORMATS[image_format]) if directory else None
+                jobs.append((canvas_name, self.export_executor.submit(encode_image, image, image_format, compress_level, lossy_palette, path)))
+
+        self.label_export_report.configure(text="")
+        self.poll_export_jobs(jobs)
+
+    def poll_export_jobs(self, jobs:list)-> None:
+        done = [job for _, job in jobs if job.done()]
+        if len(done) < len(jobs):
+            self.set_io_progress(0.5 + len(done) / len(jobs) / 2, f"Encoding {len(done)}/{len(jobs)}...")
+            self.after(IMAGE_POLL_DELAY, lambda: self.poll_export_jobs(jobs))
+            return
+
+        report = []
+        for canvas_name, job in jobs:
+            try:
+                label, size, seconds = job.result()
+                report.append(f"{canvas_name} - {label} : {size / 1024:.1f} KB, {seconds * 1000:.0f} ms")
+            except (OSError, ValueError) as error:
+                report.append(f"{canvas_name} - {error}")
+        self.label_export_report.configure(text="\n".join(report))
+        self.set_io_progress(1, f"Encoded {len(jobs)} images")
+
+    def export_current_canvas_image(self)-> None:
+        if self.canvas_number == 0:
+            self.show_error("There is no canvas to export")
+            return
+
+        directory = askdirectory(title=self.title_name)
+        if directory:
+            self.export_canvases_image([(self.tabview_canvas.get(), self.tabview_canvas.tab(self.tabview_canvas.get()).children.get("!canvas"))], directory)
+
+    def export_all_canvases_image(self)-> None:
+        if self.canvas_number == 0:
+            self.show_error("There is no canvas to export")
+            return
+
+        directory = askdirectory(title=self.title_name)
+        if directory:
+            self.export_canvases_image([(canvas_name, self.tabview_canvas.tab(canvas_name).children.get("!canvas")) for canvas_name in self.tabview_canvas._tab_dict], directory)
+
+    def compare_export_formats(self)-> None:
+        if self.canvas_number == 0:
+            self.show_error("There is no canvas to compare")
+            return
+
+        self.export_canvases_image([(self.tabview_canvas.get(), self.tabview_canvas.tab(self.tabview_canvas.get()).children.get("!canvas"))], image_formats=list(EXPORT_FORMATS.keys()))
+
+    def svg_to_tk_color(self, canvas, color:str, default:str="")-> str:
+        color = (color or "").strip()
+        if not color or color == "none" or color.startswith("url("):
+            return "" if color else default
+        match = re.match(r"rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)", color)
+        if match:
+            return "#%02x%02x%02x" % tuple(min(int(value), 255) for value in match.groups())
+        try:
+            canvas.winfo_rgb(color)
+            return color
+        except tk.TclError:
+            return default
+
+    def svg_to_tk_stipple(self, opacity:float)-> str:
+        if opacity >= 0.9:
+            return ""
+        for stipple, stipple_opacity in STIPPLE_OPACITIES.items():
+            if opacity >= stipple_opacity * 0.75:
+                return stipple
+        return "gray12"
+
+    def svg_shapes(self, canvas, tag:str, element, style:dict, matrix:tuple):
+        fill = self.svg_to_tk_color(canvas, style.get("fill"), "#000000")
+        stroke = self.svg_to_tk_color(canvas, style.get("stroke"))
+        opacity = parse_svg_length(style.get("opacity"), 1.0)
+        stipple = self.svg_to_tk_stipple(opacity * parse_svg_length(style.get("fill-opacity"), 1.0))
+        line_stipple = self.svg_to_tk_stipple(opacity * parse_svg_length(style.get("stroke-opacity"), 1.0))
+        scale = math.sqrt(abs(matrix[0] * matrix[3] - matrix[1] * matrix[2]))
+        width = parse_svg_length(style.get("stroke-width"), 1.0) * scale if stroke else 0
+        dash = tuple(max(1, round(float(value) * scale)) for value in re.findall(SVG_NUMBER, style.get("stroke-dasharray", "")))
+        axis_aligned = matrix[1] == 0 and matrix[2] == 0
+        shape_options = {"fill": fill, "outline": stroke, "width": width, "dash": dash, "stipple": stipple if fill else ""}
+        line_options = {"fill": stroke, "width": width, "dash": dash, "stipple": line_stipple, "capstyle": "round"}
+
+        def transform(points:list)-> list:
+            return [value for x, y in points for value in apply_matrix(matrix, x, y)]
+
+        if tag == "rect":
+            x, y = parse_svg_length(element.get("x")), parse_svg_length(element.get("y"))
+            w, h = parse_svg_length(element.get("width")), parse_svg_length(element.get("height"))
+            if axis_aligned:
+                yield "rectangle", shape_options, transform([(x, y), (x + w, y + h)])
+            else:
+                yield "polygon", shape_options, transform([(x, y), (x + w, y), (x + w, y + h), (x, y + h)])
+        elif tag in ("circle", "ellipse"):
+            cx, cy = parse_svg_length(element.get("cx")), parse_svg_length(element.get("cy"))
+            rx = parse_svg_length(element.get("rx") or element.get("r"))
+            ry = parse_svg_length(element.get("ry") or element.get("r"))
+            if axis_aligned:
+                yield "oval", shape_options, transform([(cx - rx, cy - ry), (cx + rx, cy + ry)])
+            else:
+                steps = 4 * SVG_CURVE_STEPS
+                yield "polygon", dict(shape_options, smooth=True), transform([(cx + rx * math.cos(2 * math.pi * step / steps), cy + ry * math.sin(2 * math.pi * step / steps)) for step in range(steps)])
+        elif tag == "line" and stroke:
+            yield "line", line_options, transform([(parse_svg_length(element.get("x1")), parse_svg_length(element.get("y1"))), (parse_svg_length(element.get("x2")), parse_svg_length(element.get("y2")))])
+        elif tag in ("polyline", "polygon", "path"):
+            if tag == "path":
+                subpaths = parse_svg_path(element.get("d", ""))
+            else:
+                values = [float(value) for value in re.findall(SVG_NUMBER, element.get("points", ""))]
+                subpaths = [(list(zip(values[0::2], values[1::2])), tag == "polygon")]
+            for points, closed in subpaths:
+                if len(points) < 2:
+                    continue
+                if fill:
+                    yield "polygon", shape_options, transform(points)
+                elif stroke:
+                    yield "line", line_options, transform(points + points[:1] if closed else points)
+        elif tag == "text":
+            lines = [element.text or ""]
+            for child in element:
+                if child.get("y") is not None and lines[-1].strip():
+                    lines.append("")
+                lines[-1] += "".join(child.itertext()) + (child.tail or "")
+            lines = [" ".join(line.split()) for line in lines if line.strip()]
+            if not lines:
+                return
+            first = element[0] if len(element) else None
+            if first is not None:
+                style = parse_svg_style(first, style)
+                fill = self.svg_to_tk_color(canvas, style.get("fill"), "#000000")
+            x, y = (element.get(name) or (first.get(name) if first is not None else None) for name in ("x", "y"))
+            font_size = style.get("font-size", "16px").strip()
+            size = parse_svg_length(font_size, 16.0) * scale
+            size = round(size) if font_size.endswith("pt") else -round(size)
+            row = "n" if style.get("dominant-baseline") in ("hanging", "text-before-edge") else "" if style.get("dominant-baseline") in ("central", "middle") else "s"
+            column = {"start": "w", "end": "e"}.get(style.get("text-anchor"), "" if style.get("text-anchor") == "middle" else "w")
+            family = style.get("font-family", self.font_name).split(",")[0].strip().strip("'\"")
+            font = self.get_font(family, size)
+            options = {"text": "\n".join(lines), "fill": fill, "font": font, "anchor": row + column or "center"}
+            x, y = transform([(parse_svg_length(x), parse_svg_length(y))])
+            if len(lines) > 1:
+                options["justify"] = {"w": "left", "e": "right"}.get(column, "center")
+                if row == "s":
+                    options["anchor"] = "n" + column
+                    y -= font.metrics("ascent")
+            yield "text", options, [x, y]
+        elif tag == "image":
+            href = element.get("href") or element.get("{http://www.w3.org/1999/xlink}href") or ""
+            if href.startswith("data:image/") and ";base64," in href:
+                image = Image.open(io.BytesIO(base64.b64decode(href.split(",", 1)[1])))
+                size = (max(1, round(parse_svg_length(element.get("width"), image.width) * scale)), max(1, round(parse_svg_length(element.get("height"), image.height) * scale)))
+                image = image.resize(size)
+                self.images.append(ImageTk.PhotoImage(image=image))
+                self.image_sources[str(self.images[-1])] = image
+                yield "image", {"image": self.images[-1], "anchor": "nw"}, transform([(parse_svg_length(element.get("x")), parse_svg_length(element.get("y")))])
+
+    def import_svg(self, canvas, path:str)-> list:
+        self.bulk_number += 1
+        import_tag = "import_" + str(self.bulk_number)
+        ids = []
+        try:
+            self.read_svg_elements(canvas, path, import_tag, ids)
+        except Exception:
+            self.mark_minimap_dirty(canvas, import_tag)
+            canvas.delete(import_tag)
+            self.prune_text_groups()
+            raise
+
+        if ids:
+            self.crtl_z_items.append(import_tag)
+        self.set_io_progress(1, f"Imported {len(ids)} items")
+        return ids
+
+    def read_svg_elements(self, canvas, path:str, import_tag:str, ids:list)-> None:
+        total_size = max(os.path.getsize(path), 1)
+        batch = {"key": None, "kind": None, "options": None, "coords": []}
+
+        def flush()-> None:
+            if batch["coords"]:
+                ids.extend(self.create_shapes(batch["kind"], batch["coords"], canvas=canvas, undo=False, tags=import_tag, **batch["options"]))
+            batch["coords"] = []
+
+        with open(path, "rb") as file:
+            stack = []
+            skipped = text_depth = 0
+            for index, (event, element) in enumerate(ET.iterparse(file, events=("start", "end"))):
+                tag = element.tag.rsplit("}", 1)[-1]
+                if event == "start":
+                    style, matrix = (stack[-1][1], stack[-1][2]) if stack else ({}, IDENTITY_MATRIX)
+                    stack.append((element, parse_svg_style(element, style), multiply_matrix(matrix, parse_svg_transform(element.get("transform", "")))))
+                    skipped += tag in SVG_SKIPPED_TAGS
+                    text_depth += tag == "text"
+                    continue
+
+                _, style, matrix = stack.pop()
+                skipped -= tag in SVG_SKIPPED_TAGS
+                text_depth -= tag == "text"
+                if not skipped and tag not in SVG_SKIPPED_TAGS:
+                    for kind, options, coords in self.svg_shapes(canvas, tag, element, style, matrix):
+                        key = (kind, tuple((name, str(value)) for name, value in options.items()))
+                        if key != batch["key"] or len(batch["coords"]) >= BULK_CHUNK_SIZE:
+                            flush()
+                            batch.update(key=key, kind=kind, options=options)
+                        batch["coords"].append(coords)
+                if stack and not text_depth:
+                    stack[-1][0].remove(element)
+                if index % SVG_PROGRESS_STEP == 0:
+                    self.set_io_progress(file.tell() / total_size, f"Importing {os.path.basename(path)}...")
+            flush()
+
+    def import_current_canvas_svg(self)-> None:
+        if self.canvas_number == 0:
+            self.show_error("There is no canvas to import into")
+            return
+
+        path = askopenfilename(title=self.title_name, filetypes=[("SVG files", "*.svg")])
+        if path:
+            try:
+                self.import_svg(self.tabview_canvas.tab(self.tabview_canvas.get()).children.get("!canvas"), path)
+            except (ET.ParseError, ValueError, OSError, tk.TclError):
+                self.set_io_progress(0)
+                self.show_error("This SVG file could not be read")
+
+    def clear_selection(self)-> None:
+        if self.selection_canvas is not None and self.selection_canvas.winfo_exists():
+            self.selection_canvas.delete("selection")
+        self.unfocus_symbols()
+        self.selected_items = []
+
+    def select_items(self, canvas, x:float, y:float)-> None:
+        canvas.delete("delete")
+        self.clear_selection()
+        self.selection_canvas = canvas
+
+        enclosed = canvas.find_enclosed(min(self.start_x, x), min(self.start_y, y), max(self.start_x, x), max(self.start_y, y))
+        self.selected_items = [item for item in enclosed if not {"delete", "selection"} & set(canvas.gettags(item))]
+        if self.selected_items:
+            for tag in {self.get_group_tag(canvas, item) for item in self.selected_items} & set(self.symbol_instances):
+                self.focus_symbol(tag)
+            canvas.create_rectangle(canvas.bbox(*self.selected_items), outline=self.action_color, dash=(3, 5), tags="selection")
+
+    def save_symbol(self)-> None:
+        name = self.entry_symbol_name.get()
+        canvas = self.selection_canvas
+        items = [item for item in self.selected_items if canvas.winfo_exists() and canvas.type(item) in SYMBOL_OPTIONS and not ({"symbol_focus"} | set(self.symbol_instances)) & set(canvas.gettags(item))] if canvas is not None else []
+
+        if not name:
+            self.show_error(message="You need to insert a name before saving it")
+            return
+        if name in self.symbols:
+            self.show_error(message="There is already a symbol with that name")
+            return
+        if not items:
+            self.show_error(message="Select items with the cursor tool first")
+            return
+
+        left, top, right, bottom = canvas.bbox(*items)
+        self.symbols[name] = self.get_item_shapes(canvas, items, (left + right) / 2, (top + bottom) / 2)
+        self.option_menu_symbol.configure(values=list(self.symbols.keys()))
+        self.option_menu_symbol.set(name)
+        self.entry_symbol_name.delete("0", "end")
+        self.focus_set()
+
+    def get_item_shapes(self, canvas, items:list, origin_x:float, origin_y:float)-> list:
+        shapes = []
+        for item in items:
+            coords = [value - (origin_x if index % 2 == 0 else origin_y) for index, value in enumerate(canvas.coords(item))]
+            shapes.append((canvas.type(item), coords, {option: canvas.itemcget(item, option) for option in SYMBOL_OPTIONS[canvas.type(item)]}))
+        return shapes
+
+    def transform_shapes(self, definition:list, scale:float, rotation:float)-> list:
+        cos, sin = math.cos(math.radians(rotation)), math.sin(math.radians(rotation))
+        shapes = []
+        for item_type, coords, options in definition:
+            points = list(zip(coords[0::2], coords[1::2]))
+            if item_type == "rectangle":
+                (x0, y0), (x1, y1) = points
+                item_type, points = "polygon", [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+            elif item_type == "oval":
+                (x0, y0), (x1, y1) = points
+                item_type, points = "polygon", [((x0 + x1) / 2 + (x1 - x0) / 2 * math.cos(2 * math.pi * step / SYMBOL_OVAL_STEPS), (y0 + y1) / 2 + (y1 - y0) / 2 * math.sin(2 * math.pi * step / SYMBOL_OVAL_STEPS)) for step in range(SYMBOL_OVAL_STEPS)]
+                options = dict(options, smooth="0")
+            shapes.append((item_type, [(scale * (x * cos - y * sin), scale * (x * sin + y * cos)) for x, y in points], options))
+        return shapes
+
+    def render_symbol_raster(self, canvas, name:str, scale:float, rotation:int)-> tuple:
+        key = (name, scale, rotation)
+        if key not in self.symbol_rasters:
+            image, left, top = self.render_shapes(canvas, self.symbols[name], scale, rotation)
+            self.symbol_rasters[key] = (ImageTk.PhotoImage(image=image), -left, -top)
+            self.image_sources[str(self.symbol_rasters[key][0])] = image
+        return self.symbol_rasters[key]
+
+    def render_shapes(self, canvas, definition:list, scale:float, rotation:float, bounds:tuple=None, supersampling:int=SYMBOL_SUPERSAMPLING)-> tuple:
+        shapes = self.transform_shapes(definition, scale * supersampling, rotation)
+        if bounds is not None:
+            left, top, right, bottom = (value * supersampling for value in bounds)
+        else:
+            margin = supersampling * scale * max([float(options.get("width", 1)) + (max(float(value) for value in re.findall(SVG_NUMBER, str(options["arrowshape"]))) if options.get("arrow", "none") != "none" else 0) for _, _, options in shapes] + [1])
+            points = [point for _, shape_points, _ in shapes for point in shape_points] or [(0, 0)]
+            left, top = min(x for x, _ in points) - margin, min(y for _, y in points) - margin
+            right, bottom = max(x for x, _ in points) + margin, max(y for _, y in points) + margin
+            for item_type, shape_points, options in shapes:
+                if item_type == "text":
+                    family, size = self.get_font_spec(canvas, options["font"])
+                    font = self.get_pil_text_font(canvas, options["text"], family, size, scale * supersampling)
+                    box = font.getbbox(options["text"], anchor=PIL_ANCHORS.get(options["anchor"], "mm"))
+                    angle = rotation - float(options.get("angle") or 0)
+                elif item_type == "image" and options["image"] in self.image_sources:
+                    source = self.image_sources[options["image"]]
+                    offset_x, offset_y = self.get_anchor_offset(options["anchor"], source.width * scale * supersampling, source.height * scale * supersampling)
+                    box = (-offset_x, -offset_y, source.width * scale * supersampling - offset_x, source.height * scale * supersampling - offset_y)
+                    angle = rotation
+                else:
+                    continue
+                cos_angle, sin_angle = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+                corners = [(shape_points[0][0] + x * cos_angle - y * sin_angle, shape_points[0][1] + x * sin_angle + y * cos_angle) for x in (box[0], box[2]) for y in (box[1], box[3])]
+                left, top = min([left] + [x for x, _ in corners]), min([top] + [y for _, y in corners])
+                right, bottom = max([right] + [x for x, _ in corners]), max([bottom] + [y for _, y in corners])
+
+        size = (max(supersampling, math.ceil(right - left)), max(supersampling, math.ceil(bottom - top)))
+        size = (size[0] + (-size[0]) % supersampling, size[1] + (-size[1]) % supersampling)
+        image = Image.new("RGBA", size, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        if supersampling == 1:
+            draw.fontmode = "1"
+        for item_type, shape_points, options in shapes:
+            shifted = [(x - left, y - top) for x, y in shape_points]
+            width = round(float(options.get("width", 1)) * scale * supersampling)
+            dash = [float(value) * scale * supersampling for value in re.findall(SVG_NUMBER, str(options.get("dash", "")))]
+            smooth = str(options.get("smooth", "0")) not in ("0", "false", "") and len(shifted) > 2
+            if item_type == "polygon":
+                path = flatten_smooth_path(shifted, True) if smooth else shifted
+                if options["fill"]:
+                    self.paint_with_pattern(image, self.svg_color(canvas, options["fill"]), options.get("stipple", ""), lambda target, color, offset: ImageDraw.Draw(target).polygon(offset_points(path, offset), fill=color), path, 0, supersampling)
+                if options["outline"] and width:
+                    self.draw_stroke(image, path + path[:1], self.svg_color(canvas, options["outline"]), width, dash)
+            elif item_type == "line" and options["fill"]:
+                path = flatten_smooth_path(shifted, False) if smooth else shifted
+                arrowshape = [float(value) * scale * supersampling for value in re.findall(SVG_NUMBER, str(options["arrowshape"]))]
+                arrows = ([(shifted[-1], shifted[-2])] if options["arrow"] in ("last", "both") else []) + ([(shifted[0], shifted[1])] if options["arrow"] in ("first", "both") else [])
+                self.paint_with_pattern(image, self.svg_color(canvas, options["fill"]), options.get("stipple", ""), lambda target, color, offset: self.draw_stroke(target, path, color, width, dash, options["capstyle"], arrows, arrowshape, offset), path, width + max(arrowshape if arrows else [0]), supersampling)
+            elif item_type == "text" and options["fill"]:
+                family, font_size = self.get_font_spec(canvas, options["font"])
+                font = self.get_pil_text_font(canvas, options["text"], family, font_size, scale * supersampling)
+                anchor = PIL_ANCHORS.get(options["anchor"], "mm")
+                angle = rotation - float(options.get("angle") or 0)
+                if not angle % 360:
+                    draw.text(shifted[0], options["text"], fill=self.svg_color(canvas, options["fill"]), font=font, anchor=anchor)
+                    continue
+                text_left, text_top, text_right, text_bottom = font.getbbox(options["text"], anchor=anchor)
+                layer = Image.new("RGBA", (max(1, math.ceil(text_right - text_left)), max(1, math.ceil(text_bottom - text_top))), (0, 0, 0, 0))
+                layer_draw = ImageDraw.Draw(layer)
+                layer_draw.fontmode = draw.fontmode
+                layer_draw.text((-text_left, -text_top), options["text"], fill=self.svg_color(canvas, options["fill"]), font=font, anchor=anchor)
+                layer, pivot = rotate_layer(layer, (-text_left, -text_top), angle, Image.BICUBIC if supersampling > 1 else Image.NEAREST)
+                composite_layer(image, layer, round(shifted[0][0] - pivot[0]), round(shifted[0][1] - pivot[1]))
+            elif item_type == "image" and options["image"] in self.image_sources:
+                source = self.image_sources[options["image"]].convert("RGBA")
+                source = source.resize((max(1, round(source.width * scale * supersampling)), max(1, round(source.height * scale * supersampling))))
+                layer, pivot = rotate_layer(source, self.get_anchor_offset(options["anchor"], source.width, source.height), rotation, Image.BICUBIC if supersampling > 1 else Image.NEAREST)
+                composite_layer(image, layer, round(shifted[0][0] - pivot[0]), round(shifted[0][1] - pivot[1]))
+
+        if supersampling > 1:
+            image = image.resize((size[0] // supersampling, size[1] // supersampling), Image.LANCZOS)
+        return (image, left / supersampling, top / supersampling)
+
+    def draw_stroke(self, target, points:list, color, width:int, dash:list=(), capstyle:str="butt", arrows:list=(), arrowshape:list=(), offset:tuple=(0, 0))-> None:
+        draw = ImageDraw.Draw(target)
+        points = offset_points(points, offset)
+        arrows = [tuple(offset_points(arrow, offset)) for arrow in arrows]
+        for stroke in (dash_polyline(points, dash) if dash else [points]):
+            if capstyle == "projecting":
+                ends = []
+                for end, previous in ((stroke[0], stroke[1]), (stroke[-1], stroke[-2])):
+                    length = math.hypot(end[0] - previous[0], end[1] - previous[1]) or 1
+                    ends.append((end[0] + (end[0] - previous[0]) / length * width / 2, end[1] + (end[1] - previous[1]) / length * width / 2))
+                stroke = [ends[0]] + stroke[1:-1] + [ends[1]]
+            draw.line(stroke, fill=color, width=width, joint="curve")
+            if capstyle == "round" and width > 2:
+                for x, y in (stroke[0], stroke[-1]):
+                    draw.ellipse((x - width / 2, y - width / 2, x + width / 2, y + width / 2), fill=color)
+        for tip, tail in arrows:
+            draw.polygon(get_arrow_points(tip, tail, width, arrowshape), fill=color)
+
+    def render_canvas_image(self, canvas):
+        items = [item for item in self.get_drawing_items(canvas) if canvas.type(item) in SYMBOL_OPTIONS and canvas.itemcget(item, "state") != "hidden"]
+        left, top, right, bottom = (canvas.bbox(*items) if items else None) or (0, 0, canvas.winfo_width(), canvas.winfo_height())
+        image, _, _ = self.render_shapes(canvas, self.get_item_shapes(canvas, items, 0, 0), 1, 0, (left, top, right, bottom), 1)
+        background = Image.new("RGBA", image.size, self.svg_color(canvas, canvas.cget("background")))
+        background.alpha_composite(image)
+        return background.convert("RGB")
+
+    def load_image_pyramid(self, path:str):
+        key = (os.path.abspath(path), 0)
+        with self.pyramid_lock:
+            if key in self.pyramid_levels:
+                self.pyramid_levels.move_to_end(key)
+                return self.pyramid_levels[key]
+
+        source = Image.open(path)
+        if source.mode not in ("RGB", "RGBA"):
+            source = source.convert("RGBA" if "A" in source.getbands() or "transparency" in source.info else "RGB")
+        source.load()
+        self.pyramid_sizes[key[0]] = source.size
+        return self.cache_pyramid_level(key, source)
+
+    def cache_pyramid_level(self, key:tuple, image):
+        with self.pyramid_lock:
+            if key in self.pyramid_levels:
+                return self.pyramid_levels[key]
+            self.pyramid_levels[key] = image
+            self.pyramid_bytes += len(image.getbands()) * image.width * image.height
+            for cached_key in list(self.pyramid_levels):
+                if self.pyramid_bytes <= IMAGE_CACHE_BYTES:
+                    break
+                if cached_key != key:
+                    evicted = self.pyramid_levels.pop(cached_key)
+                    self.pyramid_bytes -= len(evicted.getbands()) * evicted.width * evicted.height
+        return image
+
+    def get_pyramid_level(self, path:str, level:int):
+        with self.pyramid_lock:
+            if (path, level) in self.pyramid_levels:
+                self.pyramid_levels.move_to_end((path, level))
+                return self.pyramid_levels[(path, level)]
+            available = max((known_level for known_path, known_level in self.pyramid_levels if known_path == path and known_level < level), default=None)
+            image = self.pyramid_levels[(path, available)] if available is not None else None
+
+        if image is None:
+            image, available = self.load_image_pyramid(path), 0
+        for _ in range(level - available):
+            image = image.reduce(2)
+        return self.cache_pyramid_level((path, level), image)
+
+    def render_pyramid_image(self, path:str, width:int, height:int, crop:tuple):
+        if path not in self.pyramid_sizes:
+            self.load_image_pyramid(path)
+        source_width, source_height = self.pyramid_sizes[path]
+        level = max(0, math.floor(math.log2(max(min(source_width / width, source_height / height), 1))))
+        image = self.get_pyramid_level(path, level)
+        if crop is None:
+            return image.resize((width, height), Image.LANCZOS)
+        scale_x, scale_y = image.width / width, image.height / height
+        return image.resize((crop[2] - crop[0], crop[3] - crop[1]), Image.LANCZOS, box=(crop[0] * scale_x, crop[1] * scale_y, crop[2] * scale_x, crop[3] * scale_y))
+
+    def register_image_item(self, canvas, item, photo, anchor:str)-> None:
+        path = self.image_pyramid_keys.get(str(photo))
+        if path is not None:
+            self.image_items[(str(canvas), item)] = {"canvas": canvas, "item": item, "path": path, "base_size": (photo.width(), photo.height()), "scale": 1.0, "anchor": anchor, "offset": (0.0, 0.0), "photo": photo, "request": None, "job": None}
+
+    def scale_image_items(self, canvas, factor:float)-> None:
+        for key, entry in list(self.image_items.items()):
+            if entry["canvas"] is canvas:
+                entry["scale"] *= factor
+                entry["offset"] = (entry["offset"][0] * factor, entry["offset"][1] * factor)
+                self.request_image_render(key)
+
+    def refresh_cropped_images(self, canvas)-> None:
+        for key, entry in list(self.image_items.items()):
+            if entry["canvas"] is canvas and entry["request"] and entry["request"][2] is not None:
+                self.request_image_render(key)
+
+    def get_image_anchor_point(self, entry:dict)-> tuple:
+        item_x, item_y = entry["canvas"].coords(entry["item"])
+        return (item_x + entry["offset"][0], item_y + entry["offset"][1])
+
+    def request_image_render(self, key:tuple)-> None:
+        entry = self.image_items[key]
+        canvas = entry["canvas"]
+        if not canvas.winfo_exists() or canvas.type(entry["item"]) is None:
+            del self.image_items[key]
+            return
+
+        width = max(1, round(entry["base_size"][0] * entry["scale"]))
+        height = max(1, round(entry["base_size"][1] * entry["scale"]))
+        crop = None
+        if width * height > IMAGE_CROP_PIXELS:
+            anchor_x, anchor_y = self.get_image_anchor_point(entry)
+            offset_x, offset_y = self.get_anchor_offset(entry["anchor"], width, height)
+            left, top, right, bottom = self.get_canvas_viewport(canvas)
+            margin_x, margin_y = (right - left) / 2, (bottom - top) / 2
+            crop = (max(0, math.floor(left - margin_x - anchor_x + offset_x)), max(0, math.floor(top - margin_y - anchor_y + offset_y)),
+                    min(width, math.ceil(right + margin_x - anchor_x + offset_x)), min(height, math.ceil(bottom + margin_y - anchor_y + offset_y)))
+            if crop[0] >= crop[2] or crop[1] >= crop[3]:
+                crop = (0, 0, 1, 1)
+
+        entry["request"] = (width, height, crop)
+        if entry["job"] is None:
+            entry["job"] = (entry["request"], self.image_executor.submit(self.render_pyramid_image, entry["path"], width, height, crop))
+            if not self.image_poll_pending:
+                self.image_poll_pending = True
+                self.after(IMAGE_POLL_DELAY, self.poll_image_jobs)
+
+    def poll_image_jobs(self)-> None:
+        self.image_poll_pending = False
+        for name, (photo, job) in list(self.image_loads.items()):
+            if not job.done():
+                continue
+            del self.image_loads[name]
+            try:
+                image = job.result()
+            except Exception:
+                self.show_error(message="This image file could not be read")
+                continue
+            photo.paste(image)
+            self.image_sources[name] = image
+
+        for key, entry in list(self.image_items.items()):
+            if entry["job"] is None or not entry["job"][1].done():
+                continue
+            (width, height, crop), job = entry["job"]
+            entry["job"] = None
+            canvas = entry["canvas"]
+            if not canvas.winfo_exists() or canvas.type(entry["item"]) is None:
+                del self.image_items[key]
+                continue
+            try:
+                image = job.result()
+            except Exception:
+                if entry["request"] != (width, height, crop):
+                    self.request_image_render(key)
+                continue
+
+            anchor_x, anchor_y = self.get_image_anchor_point(entry)
+            if entry["photo"] not in self.images:
+                if str(entry["photo"]) in self.get_symbol_image_names():
+                    self.symbol_image_refs[str(entry["photo"])] = entry["photo"]
+                else:
+                    self.image_sources.pop(str(entry["photo"]), None)
+            entry["photo"] = ImageTk.PhotoImage(image=image)
+            self.image_sources[str(entry["photo"])] = image
+            if crop is None:
+                canvas.itemconfigure(entry["item"], image=entry["photo"], anchor=entry["anchor"])
+                canvas.coords(entry["item"], anchor_x, anchor_y)
+                entry["offset"] = (0.0, 0.0)
+            else:
+                offset_x, offset_y = self.get_anchor_offset(entry["anchor"], width, height)
+                canvas.itemconfigure(entry["item"], image=entry["photo"], anchor="nw")
+                canvas.coords(entry["item"], anchor_x - offset_x + crop[0], anchor_y - offset_y + crop[1])
+                entry["offset"] = (offset_x - crop[0], offset_y - crop[1])
+
+            if entry["request"] != (width, height, crop):
+                self.request_image_render(key)
+
+        if (self.image_loads or any(entry["job"] is not None for entry in self.image_items.values())) and not self.image_poll_pending:
+            self.image_poll_pending = True
+            self.after(IMAGE_POLL_DELAY, self.poll_image_jobs)
+
+    def get_symbol_image_names(self)-> set:
+        return {options["image"] for definition in self.symbols.values() for item_type, _, options in definition if item_type == "image"}
+
+    def get_pattern_bits(self, stipple:str)-> tuple:
+        if stipple not in self.pattern_bits:
+            if stipple in BUILTIN_STIPPLES:
+                rows = [[bool(byte >> column & 1) for column in range(8)] for byte in BUILTIN_STIPPLES[stipple]]
+                self.pattern_bits[stipple] = (8, len(rows), rows)
+            else:
+                self.pattern_bits[stipple] = read_xbm(stipple.lstrip("@"))
+        return self.pattern_bits[stipple]
+
+    def get_pattern_tile(self, stipple:str, scale:int=1):
+        if (stipple, scale) not in self.pattern_tiles:
+            width, height, rows = self.get_pattern_bits(stipple)
+            tile = Image.new("L", (width, height))
+            tile.putdata([255 if bit else 0 for row in rows for bit in row])
+            self.pattern_tiles[(stipple, scale)] = tile.resize((width * scale, height * scale), Image.NEAREST)
+        return self.pattern_tiles[(stipple, scale)]
+
+    def get_pattern_mask(self, stipple:str, size:tuple, scale:int=1):
+        mask = self.pattern_masks.get((stipple, scale))
+        if mask is None or mask.width < size[0] or mask.height < size[1]:
+            tile = self.get_pattern_tile(stipple, scale)
+            width, height = max(size[0], mask.width if mask else 0), max(size[1], mask.height if mask else 0)
+            strip = Image.new("L", (width, tile.height))
+            for x in range(0, width, tile.width):
+                strip.paste(tile, (x, 0))
+            mask = Image.new("L", (width, height))
+            for y in range(0, height, tile.height):
+                mask.paste(strip, (0, y))
+            self.pattern_masks[(stipple, scale)] = mask
+        return mask
+
+    def paint_with_pattern(self, image, color:str, stipple:str, draw_shape, points:list, margin:float=0, scale:int=SYMBOL_SUPERSAMPLING)-> None:
+        if not stipple:
+            draw_shape(image, color, (0, 0))
+            return
+        box = (max(0, math.floor(min(x for x, _ in points) - margin)), max(0, math.floor(min(y for _, y in points) - margin)),
+               min(image.width, math.ceil(max(x for x, _ in points) + margin) + 1), min(image.height, math.ceil(max(y for _, y in points) + margin) + 1))
+        if box[0] >= box[2] or box[1] >= box[3]:
+            return
+        mask = Image.new("L", (box[2] - box[0], box[3] - box[1]), 0)
+        draw_shape(mask, 255, (box[0], box[1]))
+        image.paste(color, box, ImageChops.multiply(mask, self.get_pattern_mask(stipple, box[2:], scale).crop(box)))
+
+    def register_pattern(self, name:str, path:str)-> None:
+        stipple = "@" + os.path.abspath(path)
+        self.pattern_bits[stipple] = read_xbm(path)
+        self.patterns_dict[name] = stipple
+        for option_menu in (self.option_menu_line_pattern, self.option_menu_square_pattern, self.option_menu_polygon_pattern):
+            option_menu.configure(values=list(self.patterns_dict.keys()))
+
+    def add_custom_pattern(self)-> None:
+        path = askopenfilename(title=self.title_name, filetypes=[("XBM files", "*.xbm")])
+        if path:
+            name = os.path.splitext(os.path.basename(path))[0].replace("_", " ").capitalize()
+            if name in self.patterns_dict:
+                self.show_error(message="There is already a pattern with that name")
+                return
+            try:
+                self.register_pattern(name, path)
+            except (AttributeError, IndexError, ValueError, OSError):
+                self.show_error(message="This pattern file could not be read")
+
+    def get_font_file(self, family:str)-> str:
+        family = self.resolve_font_family(family)
+        if family.lower() not in self.font_files:
+            self.font_files[family.lower()] = self.match_font_file(family)
+        return self.font_files[family.lower()]
+
+    def match_font_file(self, family:str)-> str:
+        if shutil.which("fc-match"):
+            try:
+                path = subprocess.run(["fc-match", "--format=%{file}", family + ":style=Regular"], capture_output=True, text=True, timeout=FONT_MATCH_TIMEOUT).stdout.strip()
+                if path.lower().endswith(FONT_EXTENSIONS) and os.path.isfile(path):
+                    return path
+            except (OSError, subprocess.SubprocessError):
+                pass
+
+        if self.font_paths is None:
+            if sys.platform.startswith("win"):
+                directories = [os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts")]
+            elif sys.platform.startswith("darwin"):
+                directories = ["/Library/Fonts", "/System/Library/Fonts", os.path.expanduser("~/Library/Fonts")]
+            else:
+                directories = ["/usr/share/fonts", "/usr/local/share/fonts", os.path.expanduser("~/.local/share/fonts"), os.path.expanduser("~/.fonts")]
+            self.font_paths = [os.path.join(root, file) for directory in directories for root, _, files in os.walk(directory) for file in files if file.lower().endswith(FONT_EXTENSIONS)]
+
+        key = re.sub(r"[^a-z0-9]", "", family.lower())
+        candidates = [path for path in self.font_paths if re.sub(r"[^a-z0-9]", "", os.path.splitext(os.path.basename(path))[0].lower()).startswith(key)]
+        return min(candidates, key=lambda path: len(os.path.basename(path))) if candidates else None
+
+    def get_pil_font(self, canvas, family:str, size:float):
+        pixel_size = max(1, round(abs(size) * (float(canvas.tk.call("tk", "scaling")) if size > 0 else 1)))
+        key = (self.resolve_font_family(family), pixel_size)
+        if key not in self.pil_fonts:
+            path = self.get_font_file(family)
+            self.pil_fonts[key] = ImageFont.truetype(path, pixel_size) if path else ImageFont.load_default(pixel_size)
+        return self.pil_fonts[key]
+
+    def get_pil_text_font(self, canvas, text:str, family:str, size:int, scale:float):
+        font = self.get_pil_font(canvas, family, size * scale)
+        width = max(font.getlength(line) for line in text.split("\n"))
+        target_width = self.measure_text(text, family, size)[0] * scale
+        if width and abs(width - target_width) > 0.05 * target_width:
+            font = self.get_pil_font(canvas, family, size * scale * target_width / width)
+        return font
+
+    def get_anchor_offset(self, anchor:str, width:float, height:float)-> tuple:
+        offset_x = 0 if "w" in anchor else width if "e" in anchor else width / 2
+        offset_y = 0 if anchor.startswith("n") else height if anchor.startswith("s") else height / 2
+        return (offset_x, offset_y)
+
+    def get_symbol_bucket(self, scale:float)-> float:
+        return 2 ** (round(math.log2(max(scale, 1e-3)) * SYMBOL_SCALE_BUCKETS) / SYMBOL_SCALE_BUCKETS)
+
+    def update_symbol_instance(self, tag:str)-> None:
+        instance = self.symbol_instances[tag]
+        photo, offset_x, offset_y = self.render_symbol_raster(instance["canvas"], instance["name"], self.get_symbol_bucket(instance["scale"]), round(instance["rotation"]) % 360)
+        instance["offset"] = (offset_x, offset_y)
+        instance["canvas"].itemconfigure(instance["item"], image=photo)
+        instance["canvas"].coords(instance["item"], instance["x"] - offset_x, instance["y"] - offset_y)
+
+    def place_symbol(self, canvas, name:str, x:float, y:float)-> None:
+        tag = "symbol_" + str(self.symbol_number)
+        self.symbol_number += 1
+        self.symbol_instances[tag] = {"canvas": canvas, "name": name, "x": x, "y": y, "scale": self.slider_symbol_scale.get(), "rotation": self.slider_symbol_rotation.get(), "offset": (0, 0)}
+        self.symbol_instances[tag]["item"] = canvas.create_image(x, y, anchor="nw", tags=(tag,))
+        self.update_symbol_instance(tag)
+        self.crtl_z_items.append(tag)
+        self.mark_minimap_dirty(canvas, self.symbol_instances[tag]["item"])
+
+    def scale_symbol_instances(self, canvas, x:float, y:float, factor:float)-> None:
+        for tag, instance in list(self.symbol_instances.items()):
+            if instance["canvas"] is not canvas:
+                continue
+            if not canvas.winfo_exists() or canvas.type(instance["item"]) is None:
+                del self.symbol_instances[tag]
+                continue
+            item_x, item_y = canvas.coords(instance["item"])
+            instance["x"], instance["y"] = item_x + instance["offset"][0] * factor, item_y + instance["offset"][1] * factor
+            instance["scale"] *= factor
+            self.update_symbol_instance(tag)
+
+    def get_instance_shapes(self, tag:str)-> list:
+        instance = self.symbol_instances[tag]
+        canvas = instance["canvas"]
+        item_x, item_y = canvas.coords(instance["item"])
+        instance["x"], instance["y"] = item_x + instance["offset"][0], item_y + instance["offset"][1]
+
+        shapes = []
+        for item_type, points, options in self.transform_shapes(self.symbols[instance["name"]], instance["scale"], instance["rotation"]):
+            coords = [value for point_x, point_y in points for value in (point_x + instance["x"], point_y + instance["y"])]
+            options = dict(options)
+            if "width" in options:
+                options["width"] = float(options["width"]) * instance["scale"]
+                options["dash"] = tuple(max(1, round(float(value) * instance["scale"])) for value in re.findall(SVG_NUMBER, str(options["dash"])))
+            if "arrowshape" in options:
+                options["arrowshape"] = tuple(float(value) * instance["scale"] for value in re.findall(SVG_NUMBER, str(options["arrowshape"])))
+            if item_type == "text":
+                family, size = self.get_font_spec(canvas, options["font"])
+                options["font"] = self.get_font(family, round(size * instance["scale"]) or (1 if size > 0 else -1))
+                options["angle"] = (float(options.get("angle") or 0) - instance["rotation"]) % 360
+            elif item_type == "image" and options["image"] in self.image_sources:
+                options["image"], options["anchor"] = self.get_symbol_photo(options["image"], options["anchor"], instance["scale"], instance["rotation"])
+            shapes.append((item_type, coords, options))
+        return shapes
+
+    def get_symbol_photo(self, name:str, anchor:str, scale:float, rotation:float)-> tuple:
+        key = (name, anchor, self.get_symbol_bucket(scale), round(rotation) % 360)
+        if key[2] == 1 and not key[3]:
+            return (name, anchor)
+        if key not in self.symbol_photos:
+            source = self.image_sources[name].convert("RGBA")
+            source = source.resize((max(1, round(source.width * key[2])), max(1, round(source.height * key[2]))), Image.LANCZOS)
+            layer, _ = rotate_layer(source, self.get_anchor_offset(anchor, source.width, source.height), key[3])
+            self.symbol_photos[key] = (ImageTk.PhotoImage(image=layer), anchor if not key[3] else "center")
+            self.image_sources[str(self.symbol_photos[key][0])] = layer
+        return self.symbol_photos[key]
+
+    def focus_symbol(self, tag:str)-> None:
+        instance = self.symbol_instances[tag]
+        canvas = instance["canvas"]
+
+        for item_type, coords, options in self.get_instance_shapes(tag):
+            getattr(canvas, "create_" + item_type)(coords, tags=(tag, "symbol_focus"), **options)
+
+        canvas.itemconfigure(instance["item"], state="hidden")
+        self.focused_symbols.add(tag)
+
+    def unfocus_symbols(self)-> None:
+        for tag in self.focused_symbols:
+            instance = self.symbol_instances.get(tag)
+            if instance is None or not instance["canvas"].winfo_exists() or instance["canvas"].type(instance["item"]) is None:
+                self.symbol_instances.pop(tag, None)
+                continue
+            canvas = instance["canvas"]
+            canvas.delete("symbol_focus")
+            canvas.itemconfigure(instance["item"], state="normal")
+            item_x, item_y = canvas.coords(instance["item"])
+            instance["x"], instance["y"] = item_x + instance["offset"][0], item_y + instance["offset"][1]
+        self.focused_symbols = set()
 
 #? Main
 if __name__ == "__main__":
-    App()
\ No newline at end of file
+    App()
@@ -0,0 +1,46 @@
+import math
+
+import pytest
+
+from main import apply_matrix, dash_polyline, parse_svg_path, parse_svg_transform
+
+def test_path_compact_arc_flags():
+    compact = parse_svg_path("M2 2h10a2 2 0 012 2v6H2z")
+    spaced = parse_svg_path("M2 2 h10 a2 2 0 0 1 2 2 v6 H2 z")
+    assert compact == spaced
+    points, closed = compact[0]
+    assert closed and len(compact) == 1
+    assert points[0] == (2.0, 2.0) and points[-1] == (2.0, 10.0)
+    assert (14.0, 4.0) in points and (14.0, 10.0) in points
+
+def test_path_arc_flags_without_separators():
+    assert parse_svg_path("M0 0a5 5 0 1010 0") == parse_svg_path("M0 0 a5 5 0 1 0 10 0")
+
+def test_path_implicit_commands():
+    assert parse_svg_path("M0,0L10,10 20,0Z m5 5 l1 1") == [([(0.0, 0.0), (10.0, 10.0), (20.0, 0.0)], True), ([(5.0, 5.0), (6.0, 6.0)], False)]
+    assert parse_svg_path("M1-2.5.5.5") == [([(1.0, -2.5), (0.5, 0.5)], False)]
+
+def test_path_stops_at_bad_data():
+    assert parse_svg_path("M0 0 L10 10 L20") == [([(0.0, 0.0), (10.0, 10.0)], False)]
+
+def test_transform_chain():
+    matrix = parse_svg_transform("translate(10 20) rotate(90) scale(2)")
+    assert apply_matrix(matrix, 1, 0) == pytest.approx((10.0, 22.0))
+
+def test_transform_rotate_about_point():
+    matrix = parse_svg_transform("rotate(180, 5, 5)")
+    assert apply_matrix(matrix, 0, 0) == pytest.approx((10.0, 10.0))
+
+def test_transform_ignores_unknown():
+    assert parse_svg_transform("perspective(3)") == (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+def test_dash_single_segment():
+    assert dash_polyline([(0, 0), (10, 0)], [3, 2]) == [[(0, 0), (3.0, 0.0)], [(5.0, 0.0), (8.0, 0.0)]]
+
+def test_dash_across_corner():
+    dashes = dash_polyline([(0, 0), (4, 0), (4, 4)], [3, 2])
+    assert dashes == [[(0, 0), (3.0, 0.0)], [(4.0, 1.0), (4, 4)]]
+    assert math.isclose(sum(math.dist(a, b) for dash in dashes for a, b in zip(dash, dash[1:])), 6.0)
+
+def test_dash_empty_pattern():
+    assert dash_polyline([(0, 0), (10, 0)], [0]) == [[(0, 0), (10, 0)]]